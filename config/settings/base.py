@@ -106,6 +106,20 @@ DATABASES = {
     }
 }
 
+# Goal list/summary responses are cached (core_apps.goals.cache), which only
+# works when every gunicorn worker, webhook and Celery process shares one
+# cache. Set REDIS_URL to use Redis; without it Django's per-process
+# LocMemCache is the default and goal response caching is switched off.
+REDIS_URL = getenv("REDIS_URL") or None
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.Argon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
@@ -211,6 +225,8 @@ PWA_REQUEST_TYPE_DISBURSE = getenv("PWA_REQUEST_TYPE_DISBURSE", "disburse")
 PWA_REQUEST_TYPE_SUBSCRIPTION = getenv("PWA_REQUEST_TYPE_SUBSCRIPTION", "subscription")
 PWA_REQUEST_TYPE_INSTALMENT = getenv("PWA_REQUEST_TYPE_INSTALMENT", "instalment")
 PWA_TIMEOUT_SECONDS = int(getenv("PWA_TIMEOUT_SECONDS", "30"))
+# Request signature digest; OnePipe expects "md5" (alternatives: "sha256", "blake2s", "blake2b128")
+PWA_SIGNATURE_ALGORITHM = getenv("PWA_SIGNATURE_ALGORITHM", "md5")
 
 # PayWithAccount configuration - consolidated for clean access
 # Usage: from django.conf import settings; config = settings.PAYWITHACCOUNT
@@ -229,6 +245,7 @@ PAYWITHACCOUNT = {
     'request_type_subscription': PWA_REQUEST_TYPE_SUBSCRIPTION,
     'request_type_instalment': PWA_REQUEST_TYPE_INSTALMENT,
     'timeout_seconds': PWA_TIMEOUT_SECONDS,
+    'signature_algorithm': PWA_SIGNATURE_ALGORITHM,
 }
 
 # Kore Fee configuration
@@ -1,3 +1,4 @@
+import sys
 from os import getenv, path
 from dotenv import load_dotenv
 from .base import * #noqa
@@ -30,3 +31,28 @@ DOMAIN = getenv("DOMAIN")
 
 #UPLOADS
 MAX_UPLOAD_SIZE = 1 * 1024 * 1024
+
+# TESTS
+# Test users never need a slow password hash (PBKDF2/Argon2); MD5 keeps
+# create_user(password=...) and client.login() cheap under `manage.py test`.
+if len(sys.argv) > 1 and sys.argv[1] == "test":
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    # Messages are English-only and tests assert on error codes, so skip
+    # translation catalog loading and lazy-string resolution.
+    USE_I18N = False
+
+    # FAST_TESTS=1 runs against in-memory SQLite for quick local iteration
+    # (no Postgres container, no on-disk test DB). CI should keep Postgres.
+    if getenv("FAST_TESTS"):
+        DATABASES = {
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            }
+        }
+
+    # Build the test schema straight from the models instead of replaying
+    # every migration. No migration carries data (RunPython/RunSQL), so the
+    # result is identical as long as `makemigrations --check` stays clean.
+    DATABASES["default"].setdefault("TEST", {})["MIGRATE"] = False
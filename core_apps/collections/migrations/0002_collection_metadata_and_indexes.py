@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-16 09:12
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("collections", "0001_initial"),
+        ("goals", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collection",
+            name="metadata",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddIndex(
+            model_name="collection",
+            index=models.Index(
+                fields=["user", "-created_at"], name="coll_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="collection",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"], name="coll_meta_gin"
+            ),
+        ),
+    ]
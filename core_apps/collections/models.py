@@ -1,6 +1,7 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from core_apps.goals.models import Goal
 
@@ -45,12 +46,16 @@ class Collection(models.Model):
     narrative = models.CharField(max_length=255, blank=True)
     raw_request = models.JSONField()
     raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(blank=True, default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['status', 'provider']),
+            models.Index(fields=['user', '-created_at'], name='coll_user_created_idx'),
+            # jsonb containment lookups, e.g. metadata__contains={'needs_validation': True}
+            GinIndex(fields=['metadata'], name='coll_meta_gin'),
         ]
     
     def clean(self):
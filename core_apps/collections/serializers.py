@@ -1,12 +1,12 @@
 from rest_framework import serializers
 from core_apps.collections.models import Collection
-from core_apps.goals.models import Goal
 
 
 class CollectionCreateSerializer(serializers.Serializer):
     """Serializer for creating collections."""
 
-    # goal_id is optional; if omitted the collection is not tied to a goal
+    # goal_id is optional; if omitted the collection is not tied to a goal.
+    # Existence/ownership is resolved by the view in a single lookup.
     goal_id = serializers.UUIDField(required=False, allow_null=True)
     amount_allocation = serializers.DecimalField(
         max_digits=14, 
@@ -25,17 +25,6 @@ class CollectionCreateSerializer(serializers.Serializer):
         allow_blank=True
     )
     
-    def validate_goal_id(self, value):
-        """Validate that goal exists."""
-        # If goal_id is None or not provided, skip validation here
-        if value in (None, ''):
-            return value
-        try:
-            Goal.objects.get(id=value)
-        except Goal.DoesNotExist:
-            raise serializers.ValidationError("Goal does not exist.")
-        return value
-    
     def validate_amount_allocation(self, value):
         """Validate that amount is positive."""
         if value <= 0:
@@ -89,6 +78,33 @@ class CollectionSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
+
+class CollectionListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for collection list responses.
+    
+    Produces the same shape as CollectionSerializer, but is declared as a plain
+    Serializer with explicit read-only fields so list requests skip
+    ModelSerializer field introspection and writable-field/validator setup.
+    """
+    
+    id = serializers.UUIDField(read_only=True)
+    user_username = serializers.CharField(source='user.username', read_only=True)
+    goal_id = serializers.ReadOnlyField()
+    goal_name = serializers.CharField(source='goal.name', read_only=True, allow_null=True)
+    amount_allocation = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    kore_fee = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    amount_total = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    currency = serializers.CharField(read_only=True)
+    provider = serializers.CharField(read_only=True)
+    request_ref = serializers.CharField(read_only=True)
+    provider_ref = serializers.CharField(read_only=True, allow_null=True)
+    status = serializers.CharField(read_only=True)
+    narrative = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+
 class CollectionCreateResponseSerializer(serializers.ModelSerializer):
     """Extended response serializer for collection creation that includes validation flags."""
     
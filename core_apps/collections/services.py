@@ -5,7 +5,7 @@ from os import getenv
 from typing import Optional, Dict, Any
 
 from django.conf import settings
-from django.db import transaction as db_transaction
+from django.db import IntegrityError, transaction as db_transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
@@ -21,6 +21,15 @@ from core_apps.integrations.paywithaccount.normalization import normalize_provid
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Normalized provider status -> Collection.status; anything else stays PENDING
+COLLECTION_STATUS_MAP = {
+    "SUCCESS": "SUCCESS",
+    "FAILED": "FAILED",
+}
+
+# Provider response keys carrying validation (OTP/challenge) context (best effort)
+VALIDATION_FIELD_KEYS = ('validation_ref', 'session_id', 'otp_reference', 'challenge_ref', 'auth_token')
+
 
 class CollectionError(Exception):
     """Exception raised for collection-related errors."""
@@ -227,13 +236,8 @@ class CollectionsService:
                     f"Collection requires validation: user={user.id}, "
                     f"provider_status={provider_status}"
                 )
-            elif normalized_status == "SUCCESS":
-                collection_status = "SUCCESS"
-            elif normalized_status == "FAILED":
-                collection_status = "FAILED"
             else:
-                # Any other status (unlikely if normalization works correctly) defaults to PENDING
-                collection_status = "PENDING"
+                collection_status = COLLECTION_STATUS_MAP.get(normalized_status, "PENDING")
             
             # Create Collection record
             collection_metadata = {
@@ -247,31 +251,50 @@ class CollectionsService:
             
             # Store validation fields in metadata if needed (defensive extraction)
             if needs_validation:
-                validation_fields = {}
-                # Common validation field names (best effort)
-                for field in ['validation_ref', 'session_id', 'otp_reference', 'challenge_ref', 'auth_token']:
-                    if field in response_json:
-                        validation_fields[field] = response_json[field]
+                validation_fields = {
+                    key: response_json[key] for key in VALIDATION_FIELD_KEYS if key in response_json
+                }
                 if validation_fields:
                     collection_metadata['validation_fields'] = validation_fields
                     logger.debug(f"Stored validation fields: {list(validation_fields.keys())}")
             
-            collection = Collection.objects.create(
-                user=user,
-                goal=goal,
-                amount_allocation=amount_allocation,
-                kore_fee=kore_fee,
-                amount_total=amount_total,
-                currency=currency,
-                provider="paywithaccount",
-                request_ref=request_ref,
-                provider_ref=provider_ref,
-                status=collection_status,
-                narrative=narrative,
-                raw_request=payload,
-                raw_response=response_json,
-                metadata=collection_metadata
-            )
+            # request_ref is unique at the DB level. transact() issues a fresh ref per
+            # call, so client retries are caught by the idempotency_key lookup above,
+            # not here; this savepoint only covers a PayWithAccount client handing
+            # back a ref that is already stored. Our own row is returned rather than
+            # writing duplicate transactions; any other integrity failure (e.g. the
+            # goal deleted mid-request) is re-raised
+            try:
+                with db_transaction.atomic():
+                    collection = Collection.objects.create(
+                        user=user,
+                        goal=goal,
+                        amount_allocation=amount_allocation,
+                        kore_fee=kore_fee,
+                        amount_total=amount_total,
+                        currency=currency,
+                        provider="paywithaccount",
+                        request_ref=request_ref,
+                        provider_ref=provider_ref,
+                        status=collection_status,
+                        narrative=narrative,
+                        raw_request=payload,
+                        raw_response=response_json,
+                        metadata=collection_metadata
+                    )
+            except IntegrityError:
+                existing = Collection.objects.filter(request_ref=request_ref).first()
+                if existing is None:
+                    raise
+                if existing.user_id != user.id:
+                    raise CollectionError(
+                        f"request_ref {request_ref} is already used by another collection"
+                    )
+                logger.info(
+                    f"Duplicate request_ref detected: returning existing collection "
+                    f"{existing.id} (request_ref={request_ref})"
+                )
+                return existing
             
             logger.info(
                 f"Collection created: {collection.id} (request_ref={request_ref}, "
@@ -281,33 +304,41 @@ class CollectionsService:
             # Create Transaction records with appropriate status
             transaction_status = "PENDING" if collection_status in ["PENDING", "INITIATED"] else collection_status
             
-            Transaction.objects.create(
-                user=user,
-                goal=goal,
-                collection=collection,
-                type="DEBIT",
-                amount=amount_allocation,
-                currency=currency,
-                status=transaction_status,
-                request_ref=request_ref,
-                occurred_at=timezone.now(),
-                metadata={"narrative": narrative}
-            )
-            
-            if kore_fee > 0:
-                Transaction.objects.create(
+            # Insert DEBIT (and FEE, if any) rows in a single multi-row INSERT
+            occurred_at = timezone.now()
+            transactions = [
+                Transaction(
                     user=user,
                     goal=goal,
                     collection=collection,
-                    type="FEE",
-                    amount=kore_fee,
+                    type="DEBIT",
+                    amount=amount_allocation,
                     currency=currency,
                     status=transaction_status,
                     request_ref=request_ref,
-                    occurred_at=timezone.now(),
-                    metadata={"narrative": "Kore processing fee"}
+                    occurred_at=occurred_at,
+                    metadata={"narrative": narrative}
+                )
+            ]
+            
+            if kore_fee > 0:
+                transactions.append(
+                    Transaction(
+                        user=user,
+                        goal=goal,
+                        collection=collection,
+                        type="FEE",
+                        amount=kore_fee,
+                        currency=currency,
+                        status=transaction_status,
+                        request_ref=request_ref,
+                        occurred_at=occurred_at,
+                        metadata={"narrative": "Kore processing fee"}
+                    )
                 )
             
+            Transaction.objects.bulk_create(transactions)
+            
             logger.info(f"Transactions created for collection {collection.id}")
             
             return collection
@@ -441,7 +472,6 @@ class CollectionsService:
             )
         
         return collection    
-    @db_transaction.atomic
     def validate_collection(
         self,
         collection: Collection,
@@ -501,13 +531,27 @@ class CollectionsService:
             f"Validating collection: {collection.id}, request_ref={collection.request_ref}"
         )
         
+        # Call validate endpoint outside any DB transaction so no row lock or
+        # pooled connection is held for the provider round-trip
         try:
-            # Call validate endpoint
             result = self.pwa_client.validate(
                 payload,
                 request_ref=collection.request_ref,
                 header_request_ref=collection.request_ref
             )
+        except PayWithAccountError as e:
+            logger.error(
+                f"PWA validation error: collection={collection.id}, "
+                f"status={e.status_code}, ref={e.request_ref}"
+            )
+            raise CollectionError(f"Validation failed with provider: {e}")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error validating collection {collection.id}: {str(e)}"
+            )
+            raise CollectionError(f"Unexpected error during validation: {str(e)}")
+        
+        try:
             response_json = result.data
             
             # Extract and normalize provider status
@@ -519,41 +563,36 @@ class CollectionsService:
                 f"normalized={normalized_status}, needs_validation={needs_validation}"
             )
             
-            # Determine new collection status
-            if normalized_status == "SUCCESS":
-                new_status = "SUCCESS"
-            elif normalized_status == "FAILED":
-                new_status = "FAILED"
-            elif needs_validation:
-                # Still waiting for validation
-                new_status = "PENDING"
-            else:
-                new_status = "PENDING"
-            
-            # Update collection
-            collection.status = new_status
-            collection.raw_response = response_json
-            collection.metadata['normalized_status'] = normalized_status
-            collection.metadata['needs_validation'] = needs_validation
-            collection.metadata['validation_attempt_at'] = timezone.now().isoformat()
-            
-            # Update validation fields if new ones provided
-            if needs_validation and 'validation_fields' not in collection.metadata:
-                validation_fields = {}
-                for field in ['validation_ref', 'session_id', 'otp_reference', 'challenge_ref', 'auth_token']:
-                    if field in response_json:
-                        validation_fields[field] = response_json[field]
-                if validation_fields:
-                    collection.metadata['validation_fields'] = validation_fields
-            
-            collection.save()
+            # Determine new collection status (still PENDING while awaiting validation)
+            new_status = COLLECTION_STATUS_MAP.get(normalized_status, "PENDING")
             
-            # Update transactions to match new status
-            transaction_status = "PENDING" if new_status == "PENDING" else new_status
-            Transaction.objects.filter(
-                collection=collection,
-                status="PENDING"  # Only update pending transactions
-            ).update(status=transaction_status)
+            with db_transaction.atomic():
+                # Re-read under row lock so concurrent updates (e.g. webhooks) are not lost
+                collection = Collection.objects.select_for_update().get(pk=collection.pk)
+                
+                # Update collection
+                collection.status = new_status
+                collection.raw_response = response_json
+                collection.metadata['normalized_status'] = normalized_status
+                collection.metadata['needs_validation'] = needs_validation
+                collection.metadata['validation_attempt_at'] = timezone.now().isoformat()
+                
+                # Update validation fields if new ones provided
+                if needs_validation and 'validation_fields' not in collection.metadata:
+                    validation_fields = {
+                        key: response_json[key] for key in VALIDATION_FIELD_KEYS if key in response_json
+                    }
+                    if validation_fields:
+                        collection.metadata['validation_fields'] = validation_fields
+                
+                collection.save()
+                
+                # Update transactions to match new status
+                transaction_status = "PENDING" if new_status == "PENDING" else new_status
+                Transaction.objects.filter(
+                    collection=collection,
+                    status="PENDING"  # Only update pending transactions
+                ).update(status=transaction_status)
             
             logger.info(
                 f"Collection validation completed: {collection.id}, "
@@ -562,19 +601,12 @@ class CollectionsService:
             
             return collection
         
-        except PayWithAccountError as e:
-            logger.error(
-                f"PWA validation error: collection={collection.id}, "
-                f"status={e.status_code}, ref={e.request_ref}"
-            )
-            raise CollectionError(f"Validation failed with provider: {e}")
         except Exception as e:
             logger.error(
                 f"Unexpected error validating collection {collection.id}: {str(e)}"
             )
             raise CollectionError(f"Unexpected error during validation: {str(e)}")
     
-    @db_transaction.atomic
     def query_collection_status(self, collection: Collection) -> Collection:
         """
         Query current status of a collection from provider.
@@ -617,9 +649,23 @@ class CollectionsService:
             f"Querying collection status: {collection.id}, reference={reference}"
         )
         
+        # Call query endpoint outside any DB transaction so no row lock or
+        # pooled connection is held for the provider round-trip
         try:
-            # Call query endpoint
             result = self.pwa_client.query(payload)
+        except PayWithAccountError as e:
+            logger.error(
+                f"PWA query error: collection={collection.id}, "
+                f"status={e.status_code}, ref={e.request_ref}"
+            )
+            raise CollectionError(f"Query failed with provider: {e}")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error querying collection {collection.id}: {str(e)}"
+            )
+            raise CollectionError(f"Unexpected error during status query: {str(e)}")
+        
+        try:
             response_json = result.data
             
             # Extract and normalize provider status
@@ -632,48 +678,41 @@ class CollectionsService:
             )
             
             # Determine new status
-            if normalized_status == "SUCCESS":
-                new_status = "SUCCESS"
-            elif normalized_status == "FAILED":
-                new_status = "FAILED"
-            elif needs_validation:
-                new_status = "PENDING"
-            else:
-                new_status = "PENDING"
+            new_status = COLLECTION_STATUS_MAP.get(normalized_status, "PENDING")
             
-            # Update collection only if status changed
-            if collection.status != new_status:
-                collection.status = new_status
-                collection.raw_response = response_json
-                collection.metadata['normalized_status'] = normalized_status
-                collection.metadata['needs_validation'] = needs_validation
-                collection.metadata['queried_at'] = timezone.now().isoformat()
-                collection.save()
-                
-                # Update transactions
-                transaction_status = "PENDING" if new_status == "PENDING" else new_status
-                Transaction.objects.filter(
-                    collection=collection,
-                    status="PENDING"  # Only update pending transactions
-                ).update(status=transaction_status)
+            with db_transaction.atomic():
+                # Re-read under row lock so concurrent updates (e.g. webhooks) are not lost
+                collection = Collection.objects.select_for_update().get(pk=collection.pk)
+                old_status = collection.status
                 
+                # Update collection only if status changed
+                if old_status != new_status:
+                    collection.status = new_status
+                    collection.raw_response = response_json
+                    collection.metadata['normalized_status'] = normalized_status
+                    collection.metadata['needs_validation'] = needs_validation
+                    collection.metadata['queried_at'] = timezone.now().isoformat()
+                    collection.save()
+                    
+                    # Update transactions
+                    transaction_status = "PENDING" if new_status == "PENDING" else new_status
+                    Transaction.objects.filter(
+                        collection=collection,
+                        status="PENDING"  # Only update pending transactions
+                    ).update(status=transaction_status)
+            
+            if old_status != new_status:
                 logger.info(
                     f"Collection status updated: {collection.id}, "
-                    f"old_status={collection.status}, new_status={new_status}"
+                    f"old_status={old_status}, new_status={new_status}"
                 )
             else:
                 logger.info(f"Collection status unchanged: {collection.id}, status={new_status}")
             
             return collection
         
-        except PayWithAccountError as e:
-            logger.error(
-                f"PWA query error: collection={collection.id}, "
-                f"status={e.status_code}, ref={e.request_ref}"
-            )
-            raise CollectionError(f"Query failed with provider: {e}")
         except Exception as e:
             logger.error(
                 f"Unexpected error querying collection {collection.id}: {str(e)}"
             )
-            raise CollectionError(f"Unexpected error during status query: {str(e)}")
\ No newline at end of file
+            raise CollectionError(f"Unexpected error during status query: {str(e)}")
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from decimal import Decimal
+from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APITestCase, APIClient
@@ -238,7 +239,38 @@ class TestCollectionsServiceIntegration(TestCase):
         
         # PWA should not have been called again
         mock_transact.assert_not_called()
-    
+
+    @patch('core_apps.collections.services.PayWithAccountClient.transact')
+    def test_create_collection_duplicate_request_ref(self, mock_transact):
+        """Test that a duplicate request_ref returns the existing collection."""
+        mock_transact.return_value = TransactionResult(
+            request_ref='req-ref-duplicate',
+            data={'status': 'success'}
+        )
+
+        with patch.dict('os.environ', {'KORE_FEE_PERCENT': '1.0'}):
+            service = CollectionsService()
+
+            collection1 = service.create_collection(
+                user=self.user,
+                goal=self.goal,
+                amount_allocation=Decimal('1000.00')
+            )
+            collection2 = service.create_collection(
+                user=self.user,
+                goal=self.goal,
+                amount_allocation=Decimal('1000.00')
+            )
+
+        self.assertEqual(collection1.id, collection2.id)
+        self.assertEqual(
+            Collection.objects.filter(request_ref='req-ref-duplicate').count(), 1
+        )
+        # No duplicate ledger rows for the retried request
+        self.assertEqual(
+            Transaction.objects.filter(request_ref='req-ref-duplicate').count(), 2
+        )
+
     def test_create_collection_invalid_amount(self):
         """Test that invalid amount raises error."""
         service = CollectionsService()
@@ -267,6 +299,53 @@ class TestCollectionsServiceIntegration(TestCase):
                 amount_allocation=Decimal('1000.00')
             )
     
+    @patch('core_apps.collections.services.PayWithAccountClient.transact')
+    def test_create_collection_duplicate_request_ref_other_user(self, mock_transact):
+        """Test that another user's request_ref is never returned."""
+        mock_transact.return_value = TransactionResult(
+            request_ref='req-ref-other-user',
+            data={'status': 'success'}
+        )
+        other_user = User.objects.create_user(
+            username='refuser',
+            email='ref@example.com',
+            password='pass123'
+        )
+
+        service = CollectionsService()
+        service.create_collection(
+            user=self.user,
+            goal=self.goal,
+            amount_allocation=Decimal('1000.00')
+        )
+
+        with self.assertRaises(CollectionError):
+            service.create_collection(
+                user=other_user,
+                goal=None,
+                amount_allocation=Decimal('1000.00')
+            )
+
+    @patch('core_apps.collections.services.Collection.objects.create')
+    @patch('core_apps.collections.services.PayWithAccountClient.transact')
+    def test_create_collection_other_integrity_error_not_reported_as_duplicate(
+        self, mock_transact, mock_create
+    ):
+        """Test that an IntegrityError with no clashing request_ref is not a duplicate."""
+        mock_transact.return_value = TransactionResult(
+            request_ref='req-ref-fk-error',
+            data={'status': 'success'}
+        )
+        mock_create.side_effect = IntegrityError('goal_id violates foreign key constraint')
+
+        service = CollectionsService()
+        with self.assertRaisesRegex(CollectionError, 'foreign key'):
+            service.create_collection(
+                user=self.user,
+                goal=self.goal,
+                amount_allocation=Decimal('1000.00')
+            )
+
     @patch('core_apps.collections.services.PayWithAccountClient.transact')
     def test_update_collection_from_webhook_success(self, mock_transact):
         """Test updating collection status from webhook."""
@@ -475,7 +554,7 @@ class TestCollectionEndpoints(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_post_collections_goal_ownership(self):
-        """Test that user cannot use another user's goal."""
+        """Test that user cannot use another user's goal (reported as not found)."""
         self.client.force_authenticate(user=self.user1)
         
         response = self.client.post(
@@ -487,7 +566,7 @@ class TestCollectionEndpoints(APITestCase):
             format='json'
         )
         
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_post_collections_negative_amount(self):
         """Test that negative amounts are rejected."""
@@ -527,17 +606,20 @@ class TestCollectionEndpoints(APITestCase):
         response = self.client.get('/api/v1/collections/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['user_username'], 'apiuser1')
+        results = response.data['results']
+        self.assertIsInstance(results, list)
+        self.assertNotIn('count', response.data)  # cursor pagination, no COUNT(*)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['user_username'], 'apiuser1')
     
     @patch('core_apps.collections.services.PayWithAccountClient.transact')
     def test_get_collections_list_isolation(self, mock_transact):
         """Test that users only see their own collections."""
-        mock_transact.return_value = TransactionResult(
-            request_ref='req-ref-isolation',
-            data={'status': 'success'}
-        )
+        # request_ref is unique, so each provider call returns its own ref
+        mock_transact.side_effect = [
+            TransactionResult(request_ref='req-ref-isolation-1', data={'status': 'success'}),
+            TransactionResult(request_ref='req-ref-isolation-2', data={'status': 'success'}),
+        ]
         
         # User1 creates a collection
         self.client.force_authenticate(user=self.user1)
@@ -566,15 +648,15 @@ class TestCollectionEndpoints(APITestCase):
         response = self.client.get('/api/v1/collections/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['user_username'], 'apiuser1')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['user_username'], 'apiuser1')
         
         # User2 lists collections
         self.client.force_authenticate(user=self.user2)
         response = self.client.get('/api/v1/collections/')
         
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['user_username'], 'apiuser2')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['user_username'], 'apiuser2')
     
     def test_get_collections_list_unauthenticated(self):
         """Test that list requires authentication."""
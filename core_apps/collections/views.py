@@ -1,12 +1,14 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from django.db import transaction
 
 from core_apps.collections.models import Collection
 from core_apps.collections.serializers import (
     CollectionCreateSerializer,
     CollectionSerializer,
+    CollectionListSerializer,
     CollectionCreateResponseSerializer,
     CollectionValidateSerializer,
     CollectionStatusResponseSerializer
@@ -23,6 +25,17 @@ class IsOwner(permissions.BasePermission):
         return obj.user == request.user
 
 
+class CollectionCursorPagination(CursorPagination):
+    """
+    Keyset pagination for collection lists.
+    
+    Pages with an indexed WHERE created_at < <cursor> seek instead of
+    OFFSET + COUNT(*), so list latency does not grow with collection count.
+    """
+    
+    ordering = '-created_at'
+
+
 class CollectionViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing collections.
@@ -35,16 +48,28 @@ class CollectionViewSet(viewsets.ModelViewSet):
     
     serializer_class = CollectionSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    pagination_class = CollectionCursorPagination
     lookup_field = 'id'
     
     def get_queryset(self):
-        """Return collections for the authenticated user."""
-        return Collection.objects.filter(user=self.request.user).order_by('-created_at')
+        """
+        Return collections for the authenticated user.
+        
+        Joins user and goal so user_username/goal_name don't trigger per-row queries.
+        """
+        return Collection.objects.filter(
+            user=self.request.user
+        ).select_related(
+            'user',
+            'goal'
+        ).order_by('-created_at')
     
     def get_serializer_class(self):
-        """Use different serializer for create requests."""
+        """Use different serializers for create and list requests."""
         if self.action == 'create':
             return CollectionCreateSerializer
+        if self.action == 'list':
+            return CollectionListSerializer
         return CollectionSerializer
     
     @transaction.atomic
@@ -72,17 +97,14 @@ class CollectionViewSet(viewsets.ModelViewSet):
         currency = serializer.validated_data.get('currency', 'NGN')
         narrative = serializer.validated_data.get('narrative', '')
         
-        # Resolve goal if provided
+        # Resolve goal if provided; existence and ownership checked in one query
+        # (another user's goal is reported as not found)
         goal = None
         if goal_id:
             try:
-                goal = Goal.objects.get(id=goal_id)
+                goal = Goal.objects.get(id=goal_id, user=request.user)
             except Goal.DoesNotExist:
                 return Response({'error': 'Goal not found'}, status=status.HTTP_404_NOT_FOUND)
-
-            # Verify user owns the goal
-            if goal.user != request.user:
-                return Response({'error': 'You do not have permission to use this goal'}, status=status.HTTP_403_FORBIDDEN)
         
         # Call service to create collection
         try:
@@ -113,9 +135,10 @@ class CollectionViewSet(viewsets.ModelViewSet):
         """
         List all collections for the authenticated user.
         
+        Cursor-paginated (newest first): follow the `next`/`previous` links.
+        
         Query parameters:
         - status: Filter by status (PENDING, INITIATED, SUCCESS, FAILED, CANCELLED)
-        - ordering: -created_at (default), created_at, status, amount_total
         """
         return super().list(request, *args, **kwargs)
     
@@ -140,7 +163,6 @@ class CollectionViewSet(viewsets.ModelViewSet):
             'status': collection.status,
             'updated_at': collection.updated_at
         })    
-    @transaction.atomic
     @action(detail=True, methods=['post'])
     def validate(self, request, id=None):
         """
@@ -188,7 +210,6 @@ class CollectionViewSet(viewsets.ModelViewSet):
         output_serializer = CollectionStatusResponseSerializer(updated_collection)
         return Response(output_serializer.data, status=status.HTTP_200_OK)
     
-    @transaction.atomic
     @action(detail=True, methods=['get'])
     def query_status(self, request, id=None):
         """
@@ -5,16 +5,36 @@ This module provides a client for interacting with the PayWithAccount API.
 All requests use the base URL configured via PWA_BASE_URL environment variable
 (default: https://api.dev.onepipe.io) and the /v2/transact endpoint.
 """
-import hashlib
-import uuid
+import itertools
+import json
+import secrets
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
 from loguru import logger
 
+from core_apps.integrations.paywithaccount.client import (
+    compute_signature,
+    resolve_signature_algorithm,
+)
 from .encryption import encrypt_secure_field
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to compact JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
 class PayWithAccountClient:
     """
@@ -42,7 +62,16 @@ class PayWithAccountClient:
                      settings.PWA_BASE_URL (defaults to https://api.dev.onepipe.io).
         """
         self.api_key = api_key or getattr(settings, "PWA_API_KEY", "")
+        self._auth_header = f"Bearer {self.api_key}"
         self.client_secret = client_secret or getattr(settings, "PWA_CLIENT_SECRET", "")
+        # Request refs are "<random 64-bit prefix>-<counter>": the counter makes
+        # refs unique within this client, the prefix across processes/restarts
+        self._ref_prefix = secrets.token_hex(8)
+        self._ref_counter = itertools.count(1)
+        # Same setting and validation as the integrations client
+        self._signature_algorithm = resolve_signature_algorithm(
+            getattr(settings, "PAYWITHACCOUNT", {})
+        )
         self.base_url = base_url or getattr(
             settings, "PWA_BASE_URL", "https://api.dev.onepipe.io"
         )
@@ -54,18 +83,35 @@ class PayWithAccountClient:
         self.endpoint_path = "/v2/transact"
         self.full_url = f"{self.base_url}{self.endpoint_path}"
 
+        # Long-lived session so transact calls reuse keep-alive TLS connections.
+        # Retry covers connection failures and 502/503/504 on idempotent methods
+        # only; urllib3 never retries POST, so a transact is never sent twice.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(
+                    total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+                ),
+            ),
+        )
+
     def _generate_request_ref(self) -> str:
-        """Generate a unique request reference."""
-        return str(uuid.uuid4())
+        """Generate a unique request reference without a per-call RNG read."""
+        return f"{self._ref_prefix}-{next(self._ref_counter)}"
 
     def _generate_signature(self, request_ref: str) -> str:
         """
-        Generate MD5 signature for request authentication.
+        Generate signature for request authentication.
 
-        Signature is computed as: MD5(request_ref;client_secret)
+        Signature is computed as: MD5(request_ref;client_secret), or with the
+        digest selected by settings.PAYWITHACCOUNT['signature_algorithm'].
         """
-        signature_string = f"{request_ref};{self.client_secret}"
-        return hashlib.md5(signature_string.encode("utf-8")).hexdigest()
+        return compute_signature(
+            request_ref, self.client_secret, self._signature_algorithm
+        )
 
     def _build_headers(self, request_ref: str) -> Dict[str, str]:
         """
@@ -79,7 +125,7 @@ class PayWithAccountClient:
         """
         return {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
+            "Authorization": self._auth_header,
             "Signature": self._generate_signature(request_ref),
         }
 
@@ -152,11 +198,11 @@ class PayWithAccountClient:
         )
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.full_url,
-                json=payload,
+                data=_dumps_payload(payload),
                 headers=headers,
-                timeout=30,
+                timeout=(3.05, 30),
             )
             response.raise_for_status()
             return response.json()
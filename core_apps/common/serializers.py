@@ -0,0 +1,26 @@
+"""
+Shared serializer helpers.
+"""
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once, then hand each instance a copy.
+    
+    ModelSerializer re-introspects the model on every instantiation. For
+    serializers whose fields depend on neither instance nor context, the
+    result can be cached per class. Copies are deep (DRF re-creates fields
+    from their constructor args), so binding never leaks between instances.
+    
+    Put the mixin before ModelSerializer in the bases. The cache is stored on
+    each concrete class, so subclasses never reuse a parent's fields.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
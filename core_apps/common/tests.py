@@ -9,3 +9,9 @@ class HealthEndpointTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_health_endpoint_is_briefly_cacheable(self):
+        response = self.client.get(reverse("common:health"))
+
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=1", response["Cache-Control"])
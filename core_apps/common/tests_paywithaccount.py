@@ -1,24 +1,40 @@
 """
 Tests for PayWithAccount client.
 """
+import json
+import os
+import unittest
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.conf import settings
 from django.test.utils import override_settings
 
-from .paywithaccount_client import PayWithAccountClient
+if not settings.configured and "DJANGO_SETTINGS_MODULE" not in os.environ:
+    # Let `python -m unittest core_apps.common.tests_paywithaccount` run
+    # without the Django test runner; the client only reads PWA_* settings.
+    settings.configure()
 
+from .paywithaccount_client import PayWithAccountClient  # noqa: E402
 
-class PayWithAccountClientTests(TestCase):
+
+class PayWithAccountClientTests(unittest.TestCase):
     """Test cases for PayWithAccountClient."""
 
-    def setUp(self):
-        """Set up test client with mock credentials."""
-        self.client = PayWithAccountClient(
+    @classmethod
+    def setUpClass(cls):
+        """Build one client with mock credentials, shared by every test."""
+        super().setUpClass()
+        cls.pwa_client = PayWithAccountClient(
             api_key="test_api_key",
             client_secret="test_secret",
             base_url="https://api.dev.onepipe.io",
         )
+        # One patcher for the whole class; tests reset and configure it.
+        cls._post_patcher = patch(
+            "core_apps.common.paywithaccount_client.requests.Session.post"
+        )
+        cls.mock_post = cls._post_patcher.start()
+        cls.addClassCleanup(cls._post_patcher.stop)
 
     def test_client_initializes_with_default_base_url(self):
         """Test that client uses default base URL when not provided."""
@@ -48,16 +64,24 @@ class PayWithAccountClientTests(TestCase):
 
     def test_endpoint_path_is_v2_transact(self):
         """Test that endpoint path is always /v2/transact."""
-        self.assertEqual(self.client.endpoint_path, "/v2/transact")
+        self.assertEqual(self.pwa_client.endpoint_path, "/v2/transact")
 
     def test_full_url_combines_base_url_and_endpoint(self):
         """Test that full_url correctly combines base_url and endpoint_path."""
         expected_url = "https://api.dev.onepipe.io/v2/transact"
-        self.assertEqual(self.client.full_url, expected_url)
+        self.assertEqual(self.pwa_client.full_url, expected_url)
+
+    def test_full_url_is_precomputed_attribute(self):
+        """Test that full_url is built once in __init__, not per access."""
+        self.assertIn("full_url", vars(self.pwa_client))
+        self.assertNotIsInstance(
+            getattr(PayWithAccountClient, "full_url", None), property
+        )
 
-    @patch("core_apps.common.paywithaccount_client.requests.post")
-    def test_transact_makes_request_to_correct_url(self, mock_post):
+    def test_transact_makes_request_to_correct_url(self):
         """Test that transact method makes request to the correct full URL."""
+        mock_post = self.mock_post
+        mock_post.reset_mock()
         mock_response = Mock()
         mock_response.json.return_value = {"status": "Successful"}
         mock_response.raise_for_status = Mock()
@@ -79,13 +103,18 @@ class PayWithAccountClientTests(TestCase):
             "details": {},
         }
 
-        self.client.transact("Get Accounts Max", transaction)
+        self.pwa_client.transact("Get Accounts Max", transaction)
 
         # Assert that the request was made to the correct URL
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         self.assertEqual(call_args[0][0], "https://api.dev.onepipe.io/v2/transact")
 
+        # Payload is pre-serialized to JSON bytes rather than passed as json=
+        sent = json.loads(call_args.kwargs["data"])
+        self.assertEqual(sent["request_type"], "Get Accounts Max")
+        self.assertEqual(sent["transaction"], transaction)
+
     @override_settings(PWA_BASE_URL="https://api.prod.onepipe.io")
     def test_client_uses_settings_base_url_when_not_provided(self):
         """Test that client reads PWA_BASE_URL from settings when not provided."""
@@ -95,26 +124,58 @@ class PayWithAccountClientTests(TestCase):
 
     def test_generate_request_ref_creates_unique_values(self):
         """Test that request references are unique."""
-        ref1 = self.client._generate_request_ref()
-        ref2 = self.client._generate_request_ref()
+        ref1 = self.pwa_client._generate_request_ref()
+        ref2 = self.pwa_client._generate_request_ref()
         self.assertNotEqual(ref1, ref2)
         self.assertIsInstance(ref1, str)
         self.assertIsInstance(ref2, str)
 
+    def test_generate_request_ref_is_prefixed_counter(self):
+        """Test that request references are '<prefix>-<counter>' strings."""
+        ref1 = self.pwa_client._generate_request_ref()
+        ref2 = self.pwa_client._generate_request_ref()
+        prefix1, counter1 = ref1.split("-")
+        prefix2, counter2 = ref2.split("-")
+
+        self.assertEqual(prefix1, prefix2)
+        self.assertEqual(len(prefix1), 16)
+        self.assertEqual(int(counter2), int(counter1) + 1)
+
+    def test_generate_request_ref_prefix_differs_per_client(self):
+        """Test that separate clients do not share a ref prefix."""
+        other = PayWithAccountClient(api_key="key", client_secret="secret")
+        self.assertNotEqual(
+            self.pwa_client._generate_request_ref(), other._generate_request_ref()
+        )
+
     def test_generate_signature_creates_md5_hash(self):
         """Test that signature generation creates MD5 hash."""
         request_ref = "test-ref-123"
-        signature = self.client._generate_signature(request_ref)
-        expected_string = f"{request_ref};{self.client.client_secret}"
+        signature = self.pwa_client._generate_signature(request_ref)
+        expected_string = f"{request_ref};{self.pwa_client.client_secret}"
         import hashlib
 
         expected_hash = hashlib.md5(expected_string.encode("utf-8")).hexdigest()
         self.assertEqual(signature, expected_hash)
 
+    @override_settings(PAYWITHACCOUNT={"signature_algorithm": "blake2s"})
+    def test_generate_signature_uses_configured_algorithm(self):
+        """Test that PAYWITHACCOUNT['signature_algorithm'] selects the signature digest."""
+        import hashlib
+
+        client = PayWithAccountClient(api_key="key", client_secret="secret")
+        signature = client._generate_signature("test-ref-123")
+
+        expected_hash = hashlib.blake2s(
+            b"test-ref-123;secret", digest_size=16
+        ).hexdigest()
+        self.assertEqual(signature, expected_hash)
+        self.assertEqual(len(signature), 32)
+
     def test_build_headers_includes_required_fields(self):
         """Test that headers include Authorization, Signature, and Content-Type."""
         request_ref = "test-ref-123"
-        headers = self.client._build_headers(request_ref)
+        headers = self.pwa_client._build_headers(request_ref)
 
         self.assertIn("Content-Type", headers)
         self.assertEqual(headers["Content-Type"], "application/json")
@@ -1,11 +1,19 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_safe
 
+# Pre-serialized body; the payload never changes, so skip json.dumps per hit.
+_HEALTH_BODY = b'{"status":"ok"}'
 
+
+@require_safe
+@cache_control(public=True, max_age=1)
 def health(request):
     """
     Simple health check endpoint.
 
     Returns HTTP 200 and a minimal JSON payload that can be used by
-    load balancers or uptime monitors.
+    load balancers or uptime monitors. The one-second public max-age lets
+    an upstream proxy coalesce bursts of probes without masking an outage.
     """
-    return JsonResponse({"status": "ok"})
+    return HttpResponse(_HEALTH_BODY, content_type="application/json")
@@ -6,6 +6,8 @@ from .models import Goal
 class GoalAdmin(admin.ModelAdmin):
     list_display = ('id', 'user', 'name', 'target_amount', 'currency', 'status', 'created_at')
     list_filter = ('status', 'currency', 'created_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
     search_fields = ('name', 'user__email')
     readonly_fields = ('id', 'created_at', 'updated_at')
     
@@ -6,3 +6,7 @@ class GoalsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core_apps.goals'
     verbose_name = _("Goals")
+    
+    def ready(self):
+        # Register the cache invalidation receivers
+        from . import signals  # noqa: F401
@@ -0,0 +1,52 @@
+"""
+Short-lived response caches for the goal list and goal summary endpoints.
+
+Entries are dropped by the receivers in core_apps.goals.signals whenever a
+goal, or a transaction or collection feeding its totals, is saved or deleted;
+GOALS_CACHE_TIMEOUT (seconds, default 300) bounds staleness for writes that
+bypass signals.
+
+Caching only happens when the default cache is shared between processes
+(Redis via REDIS_URL): with the per-process LocMemCache an invalidation in one
+gunicorn worker, webhook or Celery process would leave the others serving
+stale responses, so it is skipped.
+"""
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+def get_cache_timeout() -> int:
+    """Seconds a cached goal response is kept (settings.GOALS_CACHE_TIMEOUT)."""
+    return getattr(settings, 'GOALS_CACHE_TIMEOUT', 300)
+
+
+def caching_enabled() -> bool:
+    """True when the default cache is shared between processes (not LocMemCache)."""
+    return not isinstance(caches['default'], LocMemCache)
+
+
+def goal_list_cache_key(user_id) -> str:
+    """Cache key for a user's unfiltered first page of goals."""
+    return f'goals:list:{user_id}'
+
+
+def goal_summary_cache_key(goal_id) -> str:
+    """Cache key for a goal's summary response."""
+    return f'goal:{goal_id}:summary'
+
+
+def invalidate_goal_cache(user_id, goal_id=None):
+    """
+    Drop the cached goal list for `user_id` and, if given, the summary for `goal_id`.
+
+    Deleted now and again once the surrounding transaction commits, so a
+    request that read the old rows before the commit cannot leave them cached.
+    """
+    keys = [goal_list_cache_key(user_id)]
+    if goal_id is not None:
+        keys.append(goal_summary_cache_key(goal_id))
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
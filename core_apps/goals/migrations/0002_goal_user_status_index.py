@@ -0,0 +1,41 @@
+# Generated by Django 5.0.14 on 2026-10-16 10:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="goal",
+            name="goals_goal_user_id_bfd7ce_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="goal",
+            name="goals_goal_status_ea0ea8_idx",
+        ),
+        migrations.AlterField(
+            model_name="goal",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("ACTIVE", "Active"),
+                    ("PAUSED", "Paused"),
+                    ("COMPLETED", "Completed"),
+                    ("CANCELLED", "Cancelled"),
+                ],
+                default="ACTIVE",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="goal",
+            index=models.Index(fields=["user", "status"], name="goal_user_status_idx"),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-16 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0002_goal_user_status_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="goal",
+            name="currency",
+            field=models.CharField(
+                choices=[
+                    ("NGN", "Nigerian Naira"),
+                    ("USD", "US Dollar"),
+                    ("EUR", "Euro"),
+                    ("GBP", "British Pound"),
+                    ("KES", "Kenyan Shilling"),
+                    ("GHS", "Ghanaian Cedi"),
+                    ("ZAR", "South African Rand"),
+                ],
+                default="NGN",
+                max_length=3,
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-16 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0003_goal_currency_choices"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="goal",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("target_amount__gt", 0)),
+                name="goal_target_amount_positive",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="goal",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("name", ""), _negated=True),
+                name="goal_name_nonempty",
+            ),
+        ),
+    ]
@@ -13,6 +13,16 @@ class Goal(models.Model):
         ('CANCELLED', 'Cancelled'),
     ]
     
+    CURRENCY_CHOICES = [
+        ('NGN', 'Nigerian Naira'),
+        ('USD', 'US Dollar'),
+        ('EUR', 'Euro'),
+        ('GBP', 'British Pound'),
+        ('KES', 'Kenyan Shilling'),
+        ('GHS', 'Ghanaian Cedi'),
+        ('ZAR', 'South African Rand'),
+    ]
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -22,12 +32,11 @@ class Goal(models.Model):
     )
     name = models.CharField(max_length=120)
     target_amount = models.DecimalField(max_digits=14, decimal_places=2)
-    currency = models.CharField(max_length=3, default='NGN')
+    currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, default='NGN')
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
-        default='ACTIVE',
-        db_index=True
+        default='ACTIVE'
     )
     metadata = models.JSONField(blank=True, default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -35,8 +44,18 @@ class Goal(models.Model):
     
     class Meta:
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['status']),
+            # user_id already has the FK index; this serves "goals for user X in status Y".
+            models.Index(fields=['user', 'status'], name='goal_user_status_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(target_amount__gt=0),
+                name='goal_target_amount_positive',
+            ),
+            models.CheckConstraint(
+                condition=~models.Q(name=''),
+                name='goal_name_nonempty',
+            ),
         ]
     
     def __str__(self):
@@ -22,4 +22,5 @@ class IsOwner(permissions.BasePermission):
         Returns:
             bool: True if request.user is the owner, False otherwise
         """
-        return obj.user == request.user
+        # Compare ids so the owner row never has to be loaded
+        return obj.user_id == request.user.pk
@@ -1,9 +1,42 @@
 from decimal import Decimal
 from rest_framework import serializers
+from core_apps.common.serializers import CachedFieldsMixin
 from .models import Goal
 
+_ALLOWED_CURRENCIES = frozenset(code for code, _ in Goal.CURRENCY_CHOICES)
 
-class GoalCreateSerializer(serializers.ModelSerializer):
+# Built once; Decimal('...') parses its string on every call
+_ZERO = Decimal('0.00')
+_CENT = Decimal('0.01')
+
+
+def _validate_target_amount(value):
+    """Ensure target_amount is greater than 0."""
+    if value <= 0:
+        raise serializers.ValidationError("Target amount must be greater than 0.", code='min_value')
+    return value
+
+
+def _validate_name(value):
+    """Ensure name is not empty; returns it stripped."""
+    if not value or not value.strip():
+        raise serializers.ValidationError("Goal name cannot be empty.", code='blank')
+    return value.strip()
+
+
+def _validate_currency(value):
+    """Ensure currency is a supported 3-character code; returns it uppercased."""
+    if not value or len(value) != 3:
+        raise serializers.ValidationError(
+            "Currency must be a 3-character code (e.g., 'NGN').", code='invalid_length'
+        )
+    code = value.upper()
+    if code not in _ALLOWED_CURRENCIES:
+        raise serializers.ValidationError(f"Unsupported currency '{code}'.", code='unsupported')
+    return code
+
+
+class GoalCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for creating new goals."""
     
     currency = serializers.CharField(default='NGN', required=False)
@@ -15,21 +48,15 @@ class GoalCreateSerializer(serializers.ModelSerializer):
     
     def validate_target_amount(self, value):
         """Ensure target_amount is greater than 0."""
-        if value <= 0:
-            raise serializers.ValidationError("Target amount must be greater than 0.")
-        return value
+        return _validate_target_amount(value)
     
     def validate_name(self, value):
         """Ensure name is not empty."""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Goal name cannot be empty.")
-        return value.strip()
+        return _validate_name(value)
     
     def validate_currency(self, value):
-        """Ensure currency is a valid 3-character code."""
-        if not value or len(value) != 3:
-            raise serializers.ValidationError("Currency must be a 3-character code (e.g., 'NGN').")
-        return value.upper()
+        """Ensure currency is a supported 3-character code."""
+        return _validate_currency(value)
     
     def create(self, validated_data):
         """Create goal with current user and default status of ACTIVE."""
@@ -38,33 +65,31 @@ class GoalCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class GoalUpdateSerializer(serializers.ModelSerializer):
+class GoalUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for updating goals (partial updates only)."""
     
+    currency = serializers.CharField(required=False)
+    
     class Meta:
         model = Goal
         fields = ['name', 'target_amount', 'currency', 'metadata']
     
     def validate_target_amount(self, value):
         """Ensure target_amount is greater than 0 if provided."""
-        if value is not None and value <= 0:
-            raise serializers.ValidationError("Target amount must be greater than 0.")
+        if value is not None:
+            return _validate_target_amount(value)
         return value
     
     def validate_name(self, value):
         """Ensure name is not empty if provided."""
         if value is not None:
-            if not value or not value.strip():
-                raise serializers.ValidationError("Goal name cannot be empty.")
-            return value.strip()
+            return _validate_name(value)
         return value
     
     def validate_currency(self, value):
-        """Ensure currency is a valid 3-character code if provided."""
+        """Ensure currency is a supported 3-character code if provided."""
         if value is not None:
-            if not value or len(value) != 3:
-                raise serializers.ValidationError("Currency must be a 3-character code (e.g., 'NGN').")
-            return value.upper()
+            return _validate_currency(value)
         return value
     
     def update(self, instance, validated_data):
@@ -76,7 +101,7 @@ class GoalUpdateSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class GoalDetailSerializer(serializers.ModelSerializer):
+class GoalDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for retrieving detailed goal information."""
     
     # Decimals as strings (DRF standard)
@@ -115,40 +140,32 @@ class GoalDetailSerializer(serializers.ModelSerializer):
         Calculate total amount contributed to this goal.
         
         Returns decimal as string.
-        Placeholder: returns "0.00" for now (waiting for ledger aggregation).
-        
-        TODO: Once ledger aggregation is implemented, query the ledger
-        to sum all debit entries for this goal.
-        
-        Example implementation:
-        ```python
-        from core_apps.ledger.models import LedgerEntry
-        total = LedgerEntry.objects.filter(
-            goal=obj,
-            entry_type='DEBIT'
-        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
-        return str(total)
-        ```
+        Reads the `_total_contributed` annotation added by
+        GoalViewSet.get_queryset (sum of successful CREDIT transactions),
+        so serializing a list does not issue one SUM query per goal.
+        Falls back to "0.00" for goals loaded without the annotation.
         """
-        return "0.00"
+        total_contributed = getattr(obj, '_total_contributed', None)
+        if total_contributed is None:
+            return '0.00'
+        return str(total_contributed.quantize(_CENT))
     
     def get_progress_percent(self, obj):
         """
         Calculate progress as percentage of target.
         
-        Formula: (total_contributed / target_amount) * 100
+        Formula: (total_contributed * 100) // target_amount
         
         Returns: integer 0-100 (clamped at 100 if over-contributed)
         
-        TODO: Update to use actual total_contributed once ledger aggregation is available.
+        Derived from the `_total_contributed` annotation rather than a
+        second database expression, which would repeat its SUM subquery.
         """
-        total_contributed = Decimal(self.get_total_contributed(obj))
-        
         if obj.target_amount <= 0:
             return 0
         
-        progress = (total_contributed / obj.target_amount) * 100
+        total_contributed = getattr(obj, '_total_contributed', _ZERO)
+        progress = total_contributed * 100 // obj.target_amount
         
         # Clamp between 0 and 100
-        progress_percent = int(min(100, max(0, progress)))
-        return progress_percent
+        return int(min(100, max(0, progress)))
@@ -0,0 +1,31 @@
+"""
+Invalidate cached goal responses when the rows behind them change.
+
+Transaction status changes are made with queryset .update() in
+CollectionsService, which sends no signals; every such path saves the
+collection first, so Collection saves invalidate too.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core_apps.collections.models import Collection
+from core_apps.transactions.models import Transaction
+from .cache import invalidate_goal_cache
+from .models import Goal
+
+
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def invalidate_goal(sender, instance, **kwargs):
+    """Drop the owner's cached list and this goal's summary."""
+    invalidate_goal_cache(instance.user_id, instance.pk)
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Collection)
+@receiver(post_delete, sender=Collection)
+def invalidate_goal_totals(sender, instance, **kwargs):
+    """Drop cached totals for the goal a transaction or collection belongs to."""
+    invalidate_goal_cache(instance.user_id, instance.goal_id)
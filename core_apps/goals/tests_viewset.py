@@ -1,81 +1,202 @@
-from django.test import TestCase
+import tempfile
+from django.core.cache import cache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.test import TestCase, override_settings, tag
+from django.urls import reverse
 from django.contrib.auth.models import User
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
 from decimal import Decimal
+from core_apps.goals.cache import goal_list_cache_key
 from core_apps.goals.models import Goal
+from core_apps.goals.views import GoalViewSet
 from core_apps.transactions.models import Transaction
 from datetime import datetime, timezone
 
+# Fixture currency and amounts; the Decimals are parsed once at import
+NGN = 'NGN'
+TARGET_500K = Decimal('500000.00')
+TARGET_200K = Decimal('200000.00')
+TARGET_100K = Decimal('100000.00')
+TARGET_50K = Decimal('50000.00')
+AMT_600K = Decimal('600000.00')
+AMT_200K = Decimal('200000.00')
+AMT_150K = Decimal('150000.00')
+AMT_100K = Decimal('100000.00')
+AMT_50K = Decimal('50000.00')
+AMT_5K = Decimal('5000.00')
 
+# Goal detail fields plus the summary totals
+EXPECTED_SUMMARY_FIELDS = frozenset({
+    'id', 'user', 'name', 'target_amount', 'currency', 'status',
+    'metadata', 'created_at', 'updated_at',
+    'total_contributed', 'total_debited', 'total_fees', 'progress_percent'
+})
+
+# (action, method, goal, authenticated, expected status); goal is None for
+# collection routes, else 'own', 'other' (another user's) or 'missing'.
+# get_queryset is scoped to the requesting user, so another user's goal is
+# indistinguishable from a missing one: 404, not 403.
+PERMISSION_CASES = [
+    ('list', 'get', None, False, status.HTTP_401_UNAUTHORIZED),
+    ('create', 'post', None, False, status.HTTP_401_UNAUTHORIZED),
+    ('retrieve', 'get', 'own', False, status.HTTP_401_UNAUTHORIZED),
+    ('retrieve', 'get', 'other', True, status.HTTP_404_NOT_FOUND),
+    ('retrieve', 'get', 'missing', True, status.HTTP_404_NOT_FOUND),
+    ('partial_update', 'patch', 'own', False, status.HTTP_401_UNAUTHORIZED),
+    ('partial_update', 'patch', 'other', True, status.HTTP_404_NOT_FOUND),
+    ('pause', 'post', 'own', False, status.HTTP_401_UNAUTHORIZED),
+    ('pause', 'post', 'other', True, status.HTTP_404_NOT_FOUND),
+    ('resume', 'post', 'own', False, status.HTTP_401_UNAUTHORIZED),
+    ('resume', 'post', 'other', True, status.HTTP_404_NOT_FOUND),
+    ('summary', 'get', 'own', False, status.HTTP_401_UNAUTHORIZED),
+    ('summary', 'get', 'other', True, status.HTTP_404_NOT_FOUND),
+    ('summary', 'get', 'missing', True, status.HTTP_404_NOT_FOUND),
+]
+
+
+# Tests authenticate with force_authenticate, so password hashing is pure
+# fixture cost; MD5 keeps create_user cheap whatever settings module is used.
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class GoalViewSetTestCase(TestCase):
     """Test suite for Goal ViewSet endpoints."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = APIClient()
-        
+    factory = APIRequestFactory()
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and goals once per class; each test rolls back to this state."""
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='otheruser',
             email='other@example.com',
             password='otherpass123'
         )
         
-        # Authenticate as test user
-        self.client.force_authenticate(user=self.user)
-        
         # Create test goals
-        self.goal_active = Goal.objects.create(
-            user=self.user,
+        cls.goal_active = Goal.objects.create(
+            user=cls.user,
             name='Emergency Fund',
-            target_amount=Decimal('500000.00'),
-            currency='NGN',
+            target_amount=TARGET_500K,
+            currency=NGN,
             status='ACTIVE',
             metadata={'priority': 'high'}
         )
         
-        self.goal_paused = Goal.objects.create(
-            user=self.user,
+        cls.goal_paused = Goal.objects.create(
+            user=cls.user,
             name='Vacation Fund',
-            target_amount=Decimal('200000.00'),
-            currency='NGN',
+            target_amount=TARGET_200K,
+            currency=NGN,
             status='PAUSED',
             metadata={'category': 'travel'}
         )
         
-        self.other_user_goal = Goal.objects.create(
-            user=self.other_user,
+        cls.other_user_goal = Goal.objects.create(
+            user=cls.other_user,
             name='Other User Goal',
-            target_amount=Decimal('100000.00'),
-            currency='NGN',
+            target_amount=TARGET_100K,
+            currency=NGN,
             status='ACTIVE'
         )
+        
+        # Resolve routes once; the goals router is registered under basename 'goals'
+        cls.list_url = reverse('goals:goals-list')
+        active = {'id': cls.goal_active.id}
+        paused = {'id': cls.goal_paused.id}
+        cls.url_active = reverse('goals:goals-detail', kwargs=active)
+        cls.url_active_pause = reverse('goals:goals-pause', kwargs=active)
+        cls.url_active_summary = reverse('goals:goals-summary', kwargs=active)
+        cls.url_paused_resume = reverse('goals:goals-resume', kwargs=paused)
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build one API client authenticated as the test user for every test."""
+        super().setUpClass()
+        # Anonymous requests go through _call, so no per-test client is needed
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+    
+    def setUp(self):
+        """Start each test with empty goal caches; rolled-back rows send no signals."""
+        cache.clear()
+    
+    def _use_shared_cache(self):
+        """
+        Point the default cache at a file-based backend for this test.
+        
+        Like Redis, it is shared by every client opened on it, so goal
+        caching is enabled; returns the cache directory.
+        """
+        location = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(self.settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': location,
+        }}))
+        return location
+    
+    def _call(self, action, method='get', pk=None, data=None, user=None):
+        """
+        Dispatch one request straight to GoalViewSet.
+        
+        Skips URL routing and middleware, so it suits tests that only check
+        the status code or response.data; user=None sends the request
+        anonymously. The returned Response is never rendered, so no JSON is
+        encoded.
+        """
+        request = getattr(self.factory, method)('/', data)
+        force_authenticate(request, user=user)
+        view = GoalViewSet.as_view({method: action})
+        if pk is None:
+            return view(request)
+        return view(request, id=pk)
+    
+    # ============ PERMISSION TESTS ============
+    
+    # Tests tagged 'sqlite' use no Postgres-only features; `make test-goals-fast`
+    # runs just those on in-memory SQLite
+    @tag('sqlite')
+    def test_permission_matrix(self):
+        """Test that every action rejects anonymous, non-owner and unknown-goal requests."""
+        goal_ids = {
+            None: None,
+            'own': self.goal_active.id,
+            'other': self.other_user_goal.id,
+            'missing': '00000000-0000-0000-0000-000000000000',
+        }
+        for action, method, goal, authenticated, expected in PERMISSION_CASES:
+            with self.subTest(action=action, goal=goal, authenticated=authenticated):
+                response = self._call(
+                    action,
+                    method,
+                    pk=goal_ids[goal],
+                    user=self.user if authenticated else None
+                )
+                self.assertEqual(response.status_code, expected)
     
     # ============ LIST GOALS TESTS ============
     
     def test_list_goals_authenticated(self):
         """Test listing goals for authenticated user."""
-        response = self.client.get('/api/v1/goals/')
+        # One COUNT for the paginator plus one SELECT of goal columns only
+        with self.assertNumQueries(2) as ctx:
+            response = self.api_client.get(self.list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)
+        self.assertNotIn('auth_user', ctx.captured_queries[1]['sql'])
+        # total_contributed's SUM subquery appears once, not once per derived field
+        self.assertEqual(ctx.captured_queries[1]['sql'].count('SUM('), 1)
     
-    def test_list_goals_unauthenticated(self):
-        """Test that unauthenticated users cannot list goals."""
-        self.client.force_authenticate(user=None)
-        response = self.client.get('/api/v1/goals/')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
+    @tag('sqlite')
     def test_list_goals_filtered_by_user(self):
         """Test that list returns only current user's goals."""
-        response = self.client.get('/api/v1/goals/')
+        response = self.api_client.get(self.list_url)
         
         self.assertEqual(len(response.data['results']), 2)
         goal_ids = [goal['id'] for goal in response.data['results']]
@@ -88,7 +209,7 @@ class GoalViewSetTestCase(TestCase):
     
     def test_list_goals_ordered_newest_first(self):
         """Test that goals are ordered by creation date (newest first)."""
-        response = self.client.get('/api/v1/goals/')
+        response = self.api_client.get(self.list_url)
         
         results = response.data['results']
         # Paused goal was created after active goal
@@ -105,12 +226,12 @@ class GoalViewSetTestCase(TestCase):
             'currency': 'ngn',
             'metadata': {'priority': 'very high'}
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'House Fund')
         self.assertEqual(response.data['target_amount'], '5000000.00')
-        self.assertEqual(response.data['currency'], 'NGN')
+        self.assertEqual(response.data['currency'], NGN)
         self.assertEqual(response.data['status'], 'ACTIVE')
         self.assertEqual(response.data['metadata'], {'priority': 'very high'})
     
@@ -120,11 +241,11 @@ class GoalViewSetTestCase(TestCase):
             'name': 'Minimal Goal',
             'target_amount': '10000.00'
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'Minimal Goal')
-        self.assertEqual(response.data['currency'], 'NGN')  # Default
+        self.assertEqual(response.data['currency'], NGN)  # Default
         self.assertEqual(response.data['status'], 'ACTIVE')
         self.assertEqual(response.data['metadata'], {})  # Default
     
@@ -134,7 +255,7 @@ class GoalViewSetTestCase(TestCase):
             'name': 'User Test Goal',
             'target_amount': '50000.00'
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         goal = Goal.objects.get(id=response.data['id'])
         self.assertEqual(goal.user, self.user)
@@ -145,7 +266,7 @@ class GoalViewSetTestCase(TestCase):
             'name': 'Invalid Goal',
             'target_amount': '0.00'
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('target_amount', response.data)
@@ -156,7 +277,7 @@ class GoalViewSetTestCase(TestCase):
             'name': '',
             'target_amount': '50000.00'
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('name', response.data)
@@ -167,56 +288,25 @@ class GoalViewSetTestCase(TestCase):
             'name': 'Incomplete Goal'
             # Missing target_amount
         }
-        response = self.client.post('/api/v1/goals/', data)
+        response = self.api_client.post(self.list_url, data)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('target_amount', response.data)
     
-    def test_create_goal_unauthenticated(self):
-        """Test that unauthenticated users cannot create goals."""
-        self.client.force_authenticate(user=None)
-        data = {
-            'name': 'Test Goal',
-            'target_amount': '50000.00'
-        }
-        response = self.client.post('/api/v1/goals/', data)
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     # ============ RETRIEVE GOAL TESTS ============
     
     def test_retrieve_own_goal(self):
         """Test retrieving a goal that belongs to the user."""
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/')
+        response = self.api_client.get(self.url_active)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['id'], str(self.goal_active.id))
         self.assertEqual(response.data['name'], 'Emergency Fund')
         self.assertEqual(response.data['status'], 'ACTIVE')
     
-    def test_retrieve_other_user_goal_forbidden(self):
-        """Test that users cannot retrieve other users' goals."""
-        response = self.client.get(f'/api/v1/goals/{self.other_user_goal.id}/')
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
-    def test_retrieve_nonexistent_goal(self):
-        """Test retrieving a goal that doesn't exist."""
-        fake_id = '00000000-0000-0000-0000-000000000000'
-        response = self.client.get(f'/api/v1/goals/{fake_id}/')
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-    
-    def test_retrieve_unauthenticated(self):
-        """Test that unauthenticated users cannot retrieve goals."""
-        self.client.force_authenticate(user=None)
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     def test_retrieve_includes_computed_fields(self):
         """Test that retrieved goal includes computed fields."""
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/')
+        response = self.api_client.get(self.url_active)
         
         self.assertIn('total_contributed', response.data)
         self.assertIn('progress_percent', response.data)
@@ -231,25 +321,18 @@ class GoalViewSetTestCase(TestCase):
             'name': 'Updated Emergency Fund',
             'target_amount': '750000.00'
         }
-        response = self.client.patch(f'/api/v1/goals/{self.goal_active.id}/', data)
+        response = self.api_client.patch(self.url_active, data)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], 'Updated Emergency Fund')
         self.assertEqual(response.data['target_amount'], '750000.00')
-        self.assertEqual(response.data['currency'], 'NGN')  # Unchanged
+        self.assertEqual(response.data['currency'], NGN)  # Unchanged
         self.assertEqual(response.data['status'], 'ACTIVE')  # Unchanged
     
-    def test_update_other_user_goal_forbidden(self):
-        """Test that users cannot update other users' goals."""
-        data = {'name': 'Hacked Name'}
-        response = self.client.patch(f'/api/v1/goals/{self.other_user_goal.id}/', data)
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
     def test_update_prevents_user_change(self):
         """Test that update cannot change the user."""
         data = {'user': self.other_user.id}
-        response = self.client.patch(f'/api/v1/goals/{self.goal_active.id}/', data)
+        response = self.api_client.patch(self.url_active, data)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         goal = Goal.objects.get(id=self.goal_active.id)
@@ -258,7 +341,7 @@ class GoalViewSetTestCase(TestCase):
     def test_update_prevents_status_change(self):
         """Test that update cannot change the status."""
         data = {'status': 'COMPLETED'}
-        response = self.client.patch(f'/api/v1/goals/{self.goal_active.id}/', data)
+        response = self.api_client.patch(self.url_active, data)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         goal = Goal.objects.get(id=self.goal_active.id)
@@ -267,24 +350,17 @@ class GoalViewSetTestCase(TestCase):
     def test_update_invalid_target_amount(self):
         """Test updating with invalid target amount."""
         data = {'target_amount': '-50000.00'}
-        response = self.client.patch(f'/api/v1/goals/{self.goal_active.id}/', data)
+        response = self.api_client.patch(self.url_active, data)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('target_amount', response.data)
     
-    def test_update_unauthenticated(self):
-        """Test that unauthenticated users cannot update goals."""
-        self.client.force_authenticate(user=None)
-        data = {'name': 'Updated Name'}
-        response = self.client.patch(f'/api/v1/goals/{self.goal_active.id}/', data)
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     # ============ PAUSE GOAL TESTS ============
     
+    @tag('sqlite')
     def test_pause_active_goal(self):
         """Test pausing an ACTIVE goal."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_active.id}/pause/')
+        response = self.api_client.post(self.url_active_pause)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'PAUSED')
@@ -295,28 +371,15 @@ class GoalViewSetTestCase(TestCase):
     
     def test_pause_paused_goal_error(self):
         """Test pausing a goal that is already PAUSED."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_paused.id}/pause/')
+        response = self._call('pause', 'post', pk=self.goal_paused.id, user=self.user)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('detail', response.data)
         self.assertIn('PAUSED', response.data['detail'])
     
-    def test_pause_other_user_goal_forbidden(self):
-        """Test that users cannot pause other users' goals."""
-        response = self.client.post(f'/api/v1/goals/{self.other_user_goal.id}/pause/')
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
-    def test_pause_unauthenticated(self):
-        """Test that unauthenticated users cannot pause goals."""
-        self.client.force_authenticate(user=None)
-        response = self.client.post(f'/api/v1/goals/{self.goal_active.id}/pause/')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     def test_pause_returns_detail_serializer(self):
         """Test that pause action returns detail serializer response."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_active.id}/pause/')
+        response = self.api_client.post(self.url_active_pause)
         
         # Should have all detail fields
         self.assertIn('total_contributed', response.data)
@@ -329,19 +392,30 @@ class GoalViewSetTestCase(TestCase):
         goal = Goal.objects.create(
             user=self.user,
             name='Completed Goal',
-            target_amount=Decimal('50000.00'),
+            target_amount=TARGET_50K,
             status='COMPLETED'
         )
         
-        response = self.client.post(f'/api/v1/goals/{goal.id}/pause/')
+        response = self._call('pause', 'post', pk=goal.id, user=self.user)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
+    def test_pause_is_single_guarded_update(self):
+        """Test that pause writes only status/updated_at, guarded by the current status."""
+        with self.assertNumQueries(2) as ctx:
+            self.api_client.post(self.url_active_pause)
+        
+        update_sql = ctx.captured_queries[0]['sql']
+        self.assertTrue(update_sql.startswith('UPDATE'))
+        self.assertIn('"status" = \'ACTIVE\'', update_sql)
+        self.assertNotIn('"name"', update_sql)
+    
     # ============ RESUME GOAL TESTS ============
     
+    @tag('sqlite')
     def test_resume_paused_goal(self):
         """Test resuming a PAUSED goal."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_paused.id}/resume/')
+        response = self.api_client.post(self.url_paused_resume)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'ACTIVE')
@@ -352,28 +426,15 @@ class GoalViewSetTestCase(TestCase):
     
     def test_resume_active_goal_error(self):
         """Test resuming a goal that is already ACTIVE."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_active.id}/resume/')
+        response = self._call('resume', 'post', pk=self.goal_active.id, user=self.user)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('detail', response.data)
         self.assertIn('ACTIVE', response.data['detail'])
     
-    def test_resume_other_user_goal_forbidden(self):
-        """Test that users cannot resume other users' goals."""
-        response = self.client.post(f'/api/v1/goals/{self.other_user_goal.id}/resume/')
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
-    def test_resume_unauthenticated(self):
-        """Test that unauthenticated users cannot resume goals."""
-        self.client.force_authenticate(user=None)
-        response = self.client.post(f'/api/v1/goals/{self.goal_paused.id}/resume/')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     def test_resume_returns_detail_serializer(self):
         """Test that resume action returns detail serializer response."""
-        response = self.client.post(f'/api/v1/goals/{self.goal_paused.id}/resume/')
+        response = self.api_client.post(self.url_paused_resume)
         
         # Should have all detail fields
         self.assertIn('total_contributed', response.data)
@@ -386,11 +447,11 @@ class GoalViewSetTestCase(TestCase):
         goal = Goal.objects.create(
             user=self.user,
             name='Completed Goal',
-            target_amount=Decimal('50000.00'),
+            target_amount=TARGET_50K,
             status='COMPLETED'
         )
         
-        response = self.client.post(f'/api/v1/goals/{goal.id}/resume/')
+        response = self._call('resume', 'post', pk=goal.id, user=self.user)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
@@ -398,7 +459,8 @@ class GoalViewSetTestCase(TestCase):
     
     def test_list_with_pagination(self):
         """Test that list endpoint supports pagination."""
-        response = self.client.get('/api/v1/goals/')
+        with self.assertNumQueries(2):
+            response = self.api_client.get(self.list_url)
         
         self.assertIn('count', response.data)
         self.assertIn('results', response.data)
@@ -406,7 +468,7 @@ class GoalViewSetTestCase(TestCase):
     
     def test_list_ordering_by_created_at_descending(self):
         """Test that default ordering is by created_at descending."""
-        response = self.client.get('/api/v1/goals/?ordering=-created_at')
+        response = self.api_client.get(f'{self.list_url}?ordering=-created_at')
         
         results = response.data['results']
         # Most recent first
@@ -417,7 +479,7 @@ class GoalViewSetTestCase(TestCase):
     
     def test_summary_basic(self):
         """Test getting goal summary without transactions."""
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['id'], str(self.goal_active.id))
@@ -429,29 +491,32 @@ class GoalViewSetTestCase(TestCase):
     
     def test_summary_with_successful_credits(self):
         """Test summary with successful CREDIT transactions."""
+        now = datetime.now(timezone.utc)
         # Create successful credit transactions
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='CREDIT',
-            amount=Decimal('100000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req001',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='CREDIT',
-            amount=Decimal('150000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req002',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                goal=self.goal_active,
+                type='CREDIT',
+                amount=AMT_100K,
+                currency=NGN,
+                status='SUCCESS',
+                request_ref='req001',
+                occurred_at=now
+            ),
+            Transaction(
+                user=self.user,
+                goal=self.goal_active,
+                type='CREDIT',
+                amount=AMT_150K,
+                currency=NGN,
+                status='SUCCESS',
+                request_ref='req002',
+                occurred_at=now
+            ),
+        ])
+        
+        response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_contributed'], '250000.00')
@@ -460,40 +525,49 @@ class GoalViewSetTestCase(TestCase):
         # 250000 / 500000 * 100 = 50%
         self.assertEqual(response.data['progress_percent'], 50)
     
+    @tag('sqlite')
     def test_summary_with_all_transaction_types(self):
         """Test summary with CREDIT, DEBIT, and FEE transactions."""
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='CREDIT',
-            amount=Decimal('200000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req001',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='DEBIT',
-            amount=Decimal('50000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req002',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='FEE',
-            amount=Decimal('5000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req003',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        now = datetime.now(timezone.utc)
+        # One multi-row INSERT: bulk_create needs no savepoint, and wrapping it
+        # in atomic() would only add one inside the test transaction
+        with self.assertNumQueries(1):
+            Transaction.objects.bulk_create([
+                Transaction(
+                    user=self.user,
+                    goal=self.goal_active,
+                    type='CREDIT',
+                    amount=AMT_200K,
+                    currency=NGN,
+                    status='SUCCESS',
+                    request_ref='req001',
+                    occurred_at=now
+                ),
+                Transaction(
+                    user=self.user,
+                    goal=self.goal_active,
+                    type='DEBIT',
+                    amount=AMT_50K,
+                    currency=NGN,
+                    status='SUCCESS',
+                    request_ref='req002',
+                    occurred_at=now
+                ),
+                Transaction(
+                    user=self.user,
+                    goal=self.goal_active,
+                    type='FEE',
+                    amount=AMT_5K,
+                    currency=NGN,
+                    status='SUCCESS',
+                    request_ref='req003',
+                    occurred_at=now
+                ),
+            ])
+        
+        # A single query returns the goal with all three sums
+        with self.assertNumQueries(1):
+            response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_contributed'], '200000.00')
@@ -504,19 +578,20 @@ class GoalViewSetTestCase(TestCase):
     
     def test_summary_progress_capped_at_100(self):
         """Test that progress_percent is capped at 100."""
+        now = datetime.now(timezone.utc)
         # Create transaction exceeding target amount
         Transaction.objects.create(
             user=self.user,
             goal=self.goal_active,
             type='CREDIT',
-            amount=Decimal('600000.00'),  # More than target 500000
-            currency='NGN',
+            amount=AMT_600K,  # More than target 500000
+            currency=NGN,
             status='SUCCESS',
             request_ref='req001',
-            occurred_at=datetime.now(timezone.utc)
+            occurred_at=now
         )
         
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_contributed'], '600000.00')
@@ -525,29 +600,32 @@ class GoalViewSetTestCase(TestCase):
     
     def test_summary_ignores_failed_transactions(self):
         """Test that FAILED transactions are not included in summary."""
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='CREDIT',
-            amount=Decimal('100000.00'),
-            currency='NGN',
-            status='SUCCESS',
-            request_ref='req001',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        # Create failed transaction (should be ignored)
-        Transaction.objects.create(
-            user=self.user,
-            goal=self.goal_active,
-            type='CREDIT',
-            amount=Decimal('200000.00'),
-            currency='NGN',
-            status='FAILED',
-            request_ref='req002',
-            occurred_at=datetime.now(timezone.utc)
-        )
-        
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        now = datetime.now(timezone.utc)
+        Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                goal=self.goal_active,
+                type='CREDIT',
+                amount=AMT_100K,
+                currency=NGN,
+                status='SUCCESS',
+                request_ref='req001',
+                occurred_at=now
+            ),
+            # Create failed transaction (should be ignored)
+            Transaction(
+                user=self.user,
+                goal=self.goal_active,
+                type='CREDIT',
+                amount=AMT_200K,
+                currency=NGN,
+                status='FAILED',
+                request_ref='req002',
+                occurred_at=now
+            ),
+        ])
+        
+        response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Only successful credit should be counted
@@ -556,61 +634,100 @@ class GoalViewSetTestCase(TestCase):
     
     def test_summary_ignores_pending_transactions(self):
         """Test that PENDING transactions are not included in summary."""
+        now = datetime.now(timezone.utc)
         Transaction.objects.create(
             user=self.user,
             goal=self.goal_active,
             type='CREDIT',
-            amount=Decimal('100000.00'),
-            currency='NGN',
+            amount=AMT_100K,
+            currency=NGN,
             status='PENDING',
             request_ref='req001',
-            occurred_at=datetime.now(timezone.utc)
+            occurred_at=now
         )
         
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+        response = self.api_client.get(self.url_active_summary)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_contributed'], '0.00')
         self.assertEqual(response.data['progress_percent'], 0)
     
-    def test_summary_forbidden_for_other_user(self):
-        """Test that users cannot see summary for other users' goals."""
-        response = self.client.get(f'/api/v1/goals/{self.other_user_goal.id}/summary/')
+    def test_summary_includes_all_goal_fields(self):
+        """Test that summary includes all goal detail fields."""
+        response = self.api_client.get(self.url_active_summary)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(EXPECTED_SUMMARY_FIELDS - response.data.keys(), set())
+    
+    # ============ CACHE TESTS ============
+    
+    def test_list_served_from_cache_until_goal_saved(self):
+        """Test that a repeat list is cached and a new goal invalidates it."""
+        self._use_shared_cache()
+        self.api_client.get(self.list_url)
+        with self.assertNumQueries(0):
+            response = self.api_client.get(self.list_url)
+        self.assertEqual(response.data['count'], 2)
+        
+        Goal.objects.create(user=self.user, name='New Car', target_amount=TARGET_50K)
+        response = self.api_client.get(self.list_url)
+        
+        self.assertEqual(response.data['count'], 3)
+    
+    def test_list_cache_invalidated_by_pause(self):
+        """Test that pausing a goal (a queryset update) refreshes the cached list."""
+        self._use_shared_cache()
+        self.api_client.get(self.list_url)
+        self.api_client.post(self.url_active_pause)
+        
+        response = self.api_client.get(self.list_url)
+        
+        statuses = {goal['id']: goal['status'] for goal in response.data['results']}
+        self.assertEqual(statuses[str(self.goal_active.id)], 'PAUSED')
+    
+    def test_summary_cache_invalidated_by_transaction_save(self):
+        """Test that saving a transaction refreshes the cached summary."""
+        self._use_shared_cache()
+        self.api_client.get(self.url_active_summary)
+        with self.assertNumQueries(0):
+            self.api_client.get(self.url_active_summary)
+        
+        Transaction.objects.create(
+            user=self.user,
+            goal=self.goal_active,
+            type='CREDIT',
+            amount=AMT_100K,
+            currency=NGN,
+            status='SUCCESS',
+            request_ref='req-cache',
+            occurred_at=datetime.now(timezone.utc)
+        )
+        response = self.api_client.get(self.url_active_summary)
         
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data['total_contributed'], '100000.00')
     
-    def test_summary_unauthenticated(self):
-        """Test that unauthenticated users cannot access summary."""
-        self.client.force_authenticate(user=None)
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+    def test_cached_summary_not_served_to_other_user(self):
+        """Test that a cached summary still goes through the ownership check for others."""
+        self._use_shared_cache()
+        self.api_client.get(self.url_active_summary)
         
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self._call('summary', pk=self.goal_active.id, user=self.other_user)
+        
+        self.assertIn(response.status_code, (status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND))
     
-    def test_summary_nonexistent_goal(self):
-        """Test summary for nonexistent goal."""
-        fake_id = '00000000-0000-0000-0000-000000000000'
-        response = self.client.get(f'/api/v1/goals/{fake_id}/summary/')
+    def test_goal_save_invalidates_other_cache_clients(self):
+        """Test that an invalidation is seen by a separate client, as in another worker."""
+        other_worker = FileBasedCache(self._use_shared_cache(), {})
+        key = goal_list_cache_key(self.user.pk)
+        self.api_client.get(self.list_url)
+        self.assertIsNotNone(other_worker.get(key))
+        
+        Goal.objects.create(user=self.user, name='New Car', target_amount=TARGET_50K)
         
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIsNone(other_worker.get(key))
     
-    def test_summary_includes_all_goal_fields(self):
-        """Test that summary includes all goal detail fields."""
-        response = self.client.get(f'/api/v1/goals/{self.goal_active.id}/summary/')
+    def test_list_not_cached_with_per_process_cache(self):
+        """Test that nothing is cached when the default cache is LocMemCache."""
+        self.api_client.get(self.list_url)
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should have all goal fields
-        self.assertIn('id', response.data)
-        self.assertIn('user', response.data)
-        self.assertIn('name', response.data)
-        self.assertIn('target_amount', response.data)
-        self.assertIn('currency', response.data)
-        self.assertIn('status', response.data)
-        self.assertIn('metadata', response.data)
-        self.assertIn('created_at', response.data)
-        self.assertIn('updated_at', response.data)
-        # Plus summary fields
-        self.assertIn('total_contributed', response.data)
-        self.assertIn('total_debited', response.data)
-        self.assertIn('total_fees', response.data)
-        self.assertIn('progress_percent', response.data)
-
+        self.assertIsNone(cache.get(goal_list_cache_key(self.user.pk)))
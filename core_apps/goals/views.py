@@ -2,7 +2,12 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q, Sum, F
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from django.utils import timezone
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from decimal import Decimal
 from .models import Goal
 from core_apps.transactions.models import Transaction
@@ -12,6 +17,46 @@ from .serializers import (
     GoalDetailSerializer
 )
 from .permissions import IsOwner
+from .cache import (
+    caching_enabled,
+    get_cache_timeout,
+    goal_list_cache_key,
+    goal_summary_cache_key,
+    invalidate_goal_cache
+)
+
+
+def _successful_sum(transaction_type):
+    """
+    Sum of a goal's SUCCESS transactions of one type, 0.00 when there are none.
+    
+    A correlated subquery rather than a join + GROUP BY, so the paginator's
+    COUNT stays a plain count over goals. Each subquery is a range scan of
+    tx_goal_success_type_idx run once per goal row; nothing else in the
+    SELECT may reference the annotation (F() would copy the subquery into
+    the SQL again), so values derived from it are computed in Python.
+    """
+    amount_field = DecimalField(max_digits=14, decimal_places=2)
+    total = Transaction.objects.filter(
+        goal=OuterRef('pk'),
+        status='SUCCESS',
+        type=transaction_type
+    ).order_by().values('goal').annotate(total=Sum('amount')).values('total')
+    return Coalesce(
+        Subquery(total, output_field=amount_field),
+        Value(Decimal('0.00')),
+        output_field=amount_field
+    )
+
+
+# Built once and reused: Django copies expressions when it resolves them into a query
+_TOTAL_CONTRIBUTED = _successful_sum('CREDIT')
+_TOTAL_DEBITED = _successful_sum('DEBIT')
+_TOTAL_FEES = _successful_sum('FEE')
+
+
+# Summary totals are rendered to whole cents
+_CENT = Decimal('0.01')
 
 
 class GoalViewSet(viewsets.ModelViewSet):
@@ -35,6 +80,11 @@ class GoalViewSet(viewsets.ModelViewSet):
     - create/post: GoalCreateSerializer
     - update/patch: GoalUpdateSerializer
     - retrieve/list: GoalDetailSerializer
+    
+    Caching:
+    - The unfiltered list and each summary are cached per user when a
+      shared cache (REDIS_URL) is configured; see core_apps.goals.cache and
+      core_apps.goals.signals
     """
     
     permission_classes = [IsAuthenticated, IsOwner]
@@ -45,10 +95,27 @@ class GoalViewSet(viewsets.ModelViewSet):
         """
         Return goals filtered to current user only.
         
+        Each goal is annotated with `_total_contributed` (sum of successful
+        CREDIT transactions) in the same query, which GoalDetailSerializer
+        reads instead of aggregating per goal; progress_percent is derived
+        from it by the serializer.
+        
+        The owner is not joined: IsOwner compares user_id, and the
+        serializers never read the user row. The summary action also gets
+        `_total_debited` and `_total_fees` from the same query.
+        
         Returns:
             QuerySet: Goals belonging to the authenticated user
         """
-        return Goal.objects.filter(user=self.request.user).order_by(*self.ordering)
+        queryset = Goal.objects.filter(user=self.request.user).annotate(
+            _total_contributed=_TOTAL_CONTRIBUTED
+        )
+        if self.action == 'summary':
+            queryset = queryset.annotate(
+                _total_debited=_TOTAL_DEBITED,
+                _total_fees=_TOTAL_FEES
+            )
+        return queryset.order_by(*self.ordering)
     
     def get_serializer_class(self):
         """
@@ -75,6 +142,51 @@ class GoalViewSet(viewsets.ModelViewSet):
         context['request'] = self.request
         return context
     
+    def list(self, request, *args, **kwargs):
+        """
+        List the user's goals, serving the plain first page from cache.
+        
+        Requests with query parameters (page, etc.), or with no shared cache
+        configured, always hit the database.
+        """
+        if request.query_params or not caching_enabled():
+            return super().list(request, *args, **kwargs)
+        
+        key = goal_list_cache_key(request.user.pk)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, get_cache_timeout())
+        return response
+    
+    def _update_status(self, from_status, to_status):
+        """
+        Move the requested goal from `from_status` to `to_status` in one UPDATE.
+        
+        The status check is part of the WHERE clause, so two concurrent
+        requests cannot both apply the transition. .update() sends no
+        post_save, so the goal's cached responses are dropped here.
+        
+        Returns:
+            int: 1 if the transition was applied, 0 otherwise (goal missing,
+            not owned by the user, or not in `from_status`)
+        """
+        goal_id = self.kwargs[self.lookup_field]
+        try:
+            updated = Goal.objects.filter(
+                id=goal_id,
+                user=self.request.user,
+                status=from_status
+            ).update(status=to_status, updated_at=timezone.now())
+        except (TypeError, ValueError, DjangoValidationError):
+            # Malformed id; get_object would 404 on it too
+            raise Http404
+        if updated:
+            invalidate_goal_cache(self.request.user.pk, goal_id)
+        return updated
+    
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsOwner])
     def pause(self, request, id=None):
         """
@@ -95,9 +207,11 @@ class GoalViewSet(viewsets.ModelViewSet):
             403 Forbidden: User does not own goal
             404 Not Found: Goal not found
         """
+        updated = self._update_status('ACTIVE', 'PAUSED')
+        # 404s missing/foreign goals, and reloads the row with its totals
         goal = self.get_object()
         
-        if goal.status != 'ACTIVE':
+        if not updated:
             return Response(
                 {
                     'detail': f"Can only pause ACTIVE goals. Current status: {goal.status}"
@@ -105,9 +219,6 @@ class GoalViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        goal.status = 'PAUSED'
-        goal.save()
-        
         serializer = self.get_serializer(goal)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
@@ -131,9 +242,11 @@ class GoalViewSet(viewsets.ModelViewSet):
             403 Forbidden: User does not own goal
             404 Not Found: Goal not found
         """
+        updated = self._update_status('PAUSED', 'ACTIVE')
+        # 404s missing/foreign goals, and reloads the row with its totals
         goal = self.get_object()
         
-        if goal.status != 'PAUSED':
+        if not updated:
             return Response(
                 {
                     'detail': f"Can only resume PAUSED goals. Current status: {goal.status}"
@@ -141,9 +254,6 @@ class GoalViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        goal.status = 'ACTIVE'
-        goal.save()
-        
         serializer = self.get_serializer(goal)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
@@ -170,41 +280,25 @@ class GoalViewSet(viewsets.ModelViewSet):
             403 Forbidden: User does not own goal
             404 Not Found: Goal not found
         """
-        goal = self.get_object()
-        
-        # Aggregate transactions efficiently with single database query
-        transaction_summary = Transaction.objects.filter(
-            goal=goal,
-            status='SUCCESS'
-        ).aggregate(
-            total_contributed=Sum('amount', filter=Q(type='CREDIT')),
-            total_debited=Sum('amount', filter=Q(type='DEBIT')),
-            total_fees=Sum('amount', filter=Q(type='FEE'))
-        )
+        # Cached as (owner id, data); another user's hit falls through to get_object
+        use_cache = caching_enabled()
+        key = goal_summary_cache_key(id)
+        hit = cache.get(key) if use_cache else None
+        if hit is not None and hit[0] == request.user.pk:
+            return Response(hit[1], status=status.HTTP_200_OK)
         
-        # Handle null values (no transactions)
-        total_contributed = transaction_summary['total_contributed'] or Decimal('0.00')
-        total_debited = transaction_summary['total_debited'] or Decimal('0.00')
-        total_fees = transaction_summary['total_fees'] or Decimal('0.00')
-        
-        # Calculate progress percent (capped at 100)
-        if goal.target_amount > 0:
-            progress_percent = min(
-                int((total_contributed / goal.target_amount) * 100),
-                100
-            )
-        else:
-            progress_percent = 0
+        # All three sums come from get_object's query
+        goal = self.get_object()
         
-        # Get goal detail serializer data
+        # Detail serializer already renders total_contributed and progress_percent;
+        # copy into a plain dict rather than mutating the serializer's ReturnDict
         serializer = self.get_serializer(goal)
-        data = serializer.data
+        data = dict(serializer.data)
         
         # Add transaction summary fields
-        data['total_contributed'] = str(total_contributed)
-        data['total_debited'] = str(total_debited)
-        data['total_fees'] = str(total_fees)
-        data['progress_percent'] = progress_percent
+        data['total_debited'] = str(goal._total_debited.quantize(_CENT))
+        data['total_fees'] = str(goal._total_fees.quantize(_CENT))
         
+        if use_cache:
+            cache.set(key, (request.user.pk, data), get_cache_timeout())
         return Response(data, status=status.HTTP_200_OK)
-
@@ -1,11 +1,26 @@
-import uuid
+import os
+import re
+import json
 import hashlib
 import logging
-from typing import Dict, Any, Tuple
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -36,25 +51,135 @@ class PayWithAccountError(Exception):
         super().__init__(message)
 
 
-def compute_signature(request_ref: str, client_secret: str) -> str:
+# Supported signature digests (settings.PAYWITHACCOUNT['signature_algorithm'], from
+# PWA_SIGNATURE_ALGORITHM). OnePipe requires "md5"; the others are only for
+# deployments where the provider has confirmed support. Shared with
+# core_apps.common.paywithaccount_client.
+SIGNATURE_HASHERS = {
+    # A provider-mandated checksum, not a security primitive; usedforsecurity=False
+    # keeps it available on FIPS-restricted OpenSSL builds
+    "md5": partial(hashlib.md5, usedforsecurity=False),
+    "sha256": hashlib.sha256,
+    # 16-byte BLAKE2 digests keep MD5's 32-char hex length
+    "blake2s": lambda data=b"": hashlib.blake2s(data, digest_size=16),
+    "blake2b128": lambda data=b"": hashlib.blake2b(data, digest_size=16),
+}
+
+
+def resolve_signature_algorithm(config: Dict[str, Any]) -> str:
+    """
+    Return the signature digest named by a PAYWITHACCOUNT settings dict.
+    
+    Defaults to "md5"; raises ImproperlyConfigured for names that are not
+    SIGNATURE_HASHERS keys, so a bad setting fails at client construction.
+    """
+    algorithm = config.get('signature_algorithm', 'md5')
+    if algorithm not in SIGNATURE_HASHERS:
+        raise ImproperlyConfigured(
+            f"Unsupported PayWithAccount signature_algorithm: {algorithm!r}"
+        )
+    return algorithm
+
+
+@lru_cache(maxsize=8)
+def _signature_suffix(client_secret: str) -> bytes:
+    """Encoded ';<client_secret>' tail of the signature input, built once per secret."""
+    return f";{client_secret}".encode()
+
+
+def compute_signature(request_ref: str, client_secret: str, algorithm: str = "md5") -> str:
     """
-    Compute MD5 signature for PayWithAccount requests.
+    Compute the signature for PayWithAccount requests.
     
-    Format: MD5(request_ref;client_secret) with semicolon separator
+    Format: MD5(request_ref;client_secret) with semicolon separator, or the
+    digest named by `algorithm` (a SIGNATURE_HASHERS key)
     
     Args:
         request_ref: UUID reference for the request
         client_secret: Client secret from configuration
+        algorithm: Digest name; "md5" unless the provider has agreed otherwise
         
     Returns:
-        MD5 hexadecimal hash
+        Hexadecimal digest
         
     Example:
         >>> compute_signature("abc123def456", "secret123")
         'e1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6'
     """
-    data = f"{request_ref};{client_secret}"
-    return hashlib.md5(data.encode()).hexdigest()
+    # The secret comes last, so cache its encoded form rather than a seeded hasher
+    data = request_ref.encode() + _signature_suffix(client_secret)
+    return SIGNATURE_HASHERS[algorithm](data).hexdigest()
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes (orjson when available); Decimals become strings."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _loads_response(content: bytes) -> Any:
+    """Parse a JSON response body (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Refs handed out per os.urandom call
+_REF_BATCH = 64
+_ref_pool = threading.local()
+
+
+def _reset_ref_pool():
+    """Drop inherited refs in a forked child so processes never share them."""
+    global _ref_pool
+    _ref_pool = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_ref_pool)
+
+
+def _next_ref() -> str:
+    """
+    Return a random 32-char hex request reference (same shape as uuid4().hex).
+    
+    Each thread reads entropy for _REF_BATCH refs with one os.urandom call
+    and hands them out in order, instead of building a UUID per request.
+    """
+    pool = getattr(_ref_pool, "refs", None)
+    if not pool:
+        raw = os.urandom(16 * _REF_BATCH).hex()
+        pool = _ref_pool.refs = deque(raw[i:i + 32] for i in range(0, len(raw), 32))
+    return pool.popleft()
+
+
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session shared by every client.
+    
+    Services build a new PayWithAccountClient per request, so a per-client
+    session would open a fresh TCP/TLS connection each time.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=PayWithAccountClient.POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def _reset_client_config(*, setting, **kwargs):
+    """Drop the cached client configuration when PAYWITHACCOUNT changes."""
+    if setting == 'PAYWITHACCOUNT':
+        PayWithAccountClient._config = None
+
+
+setting_changed.connect(_reset_client_config)
 
 
 @dataclass
@@ -83,30 +208,88 @@ class PayWithAccountClient:
         print(result.data['status'])  # API response
     """
     
-    def __init__(self):
-        """Initialize client with settings from django.conf."""
-        self.config = settings.PAYWITHACCOUNT
-        self.base_url = self.config['base_url']
-        self.transact_path = self.config['transact_path']
-        # Optional new paths for query and validate
-        self.query_path = self.config.get('query_path', '/transact/query')
-        self.validate_path = self.config.get('validate_path', '/transact/validate')
-        self.api_key = self.config['api_key']
-        self.client_secret = self.config['client_secret']
-        self.mock_mode = self.config['mock_mode']
-        self.timeout = self.config['timeout_seconds']
+    # Keep-alive pool size per host; sized for concurrent workers polling status
+    POOL_MAXSIZE = 20
+    
+    # Instance attributes resolved from settings.PAYWITHACCOUNT, shared by every
+    # client; cleared by _reset_client_config when the setting is overridden
+    _config: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def _load_config(cls) -> Dict[str, Any]:
+        """
+        Resolve settings.PAYWITHACCOUNT once per process.
         
-        # Log initialization (redacted)
-        logger.debug(
-            f"PayWithAccountClient initialized: "
-            f"base_url={self.base_url}, timeout={self.timeout}s"
-        )
+        Services build a client per instance, so this keeps construction to
+        a single dict update instead of re-reading the lazy settings object.
         
-        if not self.api_key or not self.client_secret:
-            logger.warning(
-                "PayWithAccount credentials not fully configured. "
-                "Ensure PWA_API_KEY and PWA_CLIENT_SECRET are set in environment."
+        Returns:
+            Dict of instance attribute name -> value
+        """
+        if cls._config is None:
+            config = settings.PAYWITHACCOUNT
+            resolved = {
+                'config': config,
+                'base_url': config['base_url'],
+                'transact_path': config['transact_path'],
+                # Optional new paths for query and validate
+                'query_path': config.get('query_path', '/transact/query'),
+                'validate_path': config.get('validate_path', '/transact/validate'),
+                'api_key': config['api_key'],
+                'client_secret': config['client_secret'],
+                'mock_mode': config['mock_mode'],
+                'timeout': config['timeout_seconds'],
+                'signature_algorithm': resolve_signature_algorithm(config),
+            }
+            resolved.update(cls._build_redactor(resolved['api_key'], resolved['client_secret']))
+            
+            # Log configuration (redacted)
+            logger.debug(
+                "PayWithAccountClient configured: base_url=%s, timeout=%ss",
+                resolved['base_url'], resolved['timeout']
             )
+            
+            if not resolved['api_key'] or not resolved['client_secret']:
+                logger.warning(
+                    "PayWithAccount credentials not fully configured. "
+                    "Ensure PWA_API_KEY and PWA_CLIENT_SECRET are set in environment."
+                )
+            cls._config = resolved
+        return cls._config
+    
+    @staticmethod
+    def _build_redactor(api_key: str, client_secret: str) -> Dict[str, Any]:
+        """
+        Compile one pattern matching either credential, for _redact_sensitive.
+        
+        Longest credential first, so one containing the other is still
+        redacted whole.
+        
+        Returns:
+            Dict with '_redact_re' (None when neither is set) and '_redact_repl'
+        """
+        replacements = {}
+        if client_secret:
+            replacements[client_secret] = "***REDACTED_SECRET***"
+        if api_key:
+            # Set last: if both are equal, the api_key label wins as before
+            replacements[api_key] = "***REDACTED_API_KEY***"
+        if not replacements:
+            return {'_redact_re': None, '_redact_repl': None}
+        pattern = re.compile('|'.join(
+            re.escape(value) for value in sorted(replacements, key=len, reverse=True)
+        ))
+        return {
+            '_redact_re': pattern,
+            '_redact_repl': lambda match: replacements[match.group(0)],
+        }
+    
+    def __init__(self):
+        """Initialize client with settings from django.conf."""
+        self.__dict__.update(self._load_config())
+        
+        # Shared pooled session: reuses TCP/TLS connections across clients and calls
+        self.session = _get_session()
     
     def build_headers(self, request_ref: str) -> Dict[str, str]:
         """
@@ -126,7 +309,7 @@ class PayWithAccountClient:
             #     'Content-Type': 'application/json'
             # }
         """
-        signature = compute_signature(request_ref, self.client_secret)
+        signature = compute_signature(request_ref, self.client_secret, self.signature_algorithm)
         return {
             "Authorization": f"Bearer {self.api_key}",
             "Signature": signature,
@@ -145,14 +328,10 @@ class PayWithAccountClient:
         Returns:
             Text with secrets replaced with ***REDACTED***
         """
-        if not text:
+        if not text or self._redact_re is None:
             return text
-        redacted = text
-        if self.api_key and len(self.api_key) > 0:
-            redacted = redacted.replace(self.api_key, "***REDACTED_API_KEY***")
-        if self.client_secret and len(self.client_secret) > 0:
-            redacted = redacted.replace(self.client_secret, "***REDACTED_SECRET***")
-        return redacted
+        # Single scan for both credentials
+        return self._redact_re.sub(self._redact_repl, text)
     
     def transact(
         self,
@@ -167,7 +346,7 @@ class PayWithAccountClient:
         
         Args:
             payload: Transaction payload as dict. Should include 'transaction' key.
-            request_ref: Optional UUID hex string. If not provided, generated via uuid.uuid4().hex
+            request_ref: Optional UUID hex string. If not provided, a random 32-char hex ref is generated
             
         Returns:
             TransactionResult with request_ref and API response data
@@ -189,7 +368,7 @@ class PayWithAccountClient:
         """
         # Generate request_ref if not provided
         if not request_ref:
-            request_ref = uuid.uuid4().hex
+            request_ref = _next_ref()
         
         # Ensure transaction key exists
         if "transaction" not in payload:
@@ -206,15 +385,13 @@ class PayWithAccountClient:
         url = f"{self.base_url}{self.transact_path}"
         
         # Log request (redacted)
-        logger.debug(
-            f"PayWithAccount transact: POST {url} request_ref={request_ref}"
-        )
+        logger.debug("PayWithAccount transact: POST %s request_ref=%s", url, request_ref)
         
         try:
             # Make request
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
+                data=_dumps_payload(payload),
                 headers=headers,
                 timeout=self.timeout
             )
@@ -222,11 +399,12 @@ class PayWithAccountClient:
             # Check for non-2xx status
             if response.status_code < 200 or response.status_code >= 300:
                 error_text = response.text
-                logger.error(
-                    f"PayWithAccount API error: status={response.status_code} "
-                    f"request_ref={request_ref} "
-                    f"response={self._redact_sensitive(error_text)}"
-                )
+                # Redaction scans the whole body, so skip it when ERROR is filtered out
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "PayWithAccount API error: status=%s request_ref=%s response=%s",
+                        response.status_code, request_ref, self._redact_sensitive(error_text)
+                    )
                 raise PayWithAccountError(
                     status_code=response.status_code,
                     response_text=error_text,
@@ -234,26 +412,62 @@ class PayWithAccountClient:
                 )
             
             # Parse and return response
-            response_json = response.json()
-            logger.debug(
-                f"PayWithAccount transact success: request_ref={request_ref}"
-            )
+            response_json = _loads_response(response.content)
+            logger.debug("PayWithAccount transact success: request_ref=%s", request_ref)
             
             return TransactionResult(
                 request_ref=request_ref,
                 data=response_json
             )
         
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(
-                f"PayWithAccount network error: request_ref={request_ref} "
-                f"error={type(e).__name__}: {str(e)}"
+                "PayWithAccount network error: request_ref=%s error=%s: %s",
+                request_ref, type(e).__name__, e
             )
             raise PayWithAccountError(
                 exception=e,
                 request_ref=request_ref
             )
 
+    def transact_many(
+        self,
+        payloads: List[Dict[str, Any]]
+    ) -> List[Union[TransactionResult, PayWithAccountError]]:
+        """
+        Execute several transact calls concurrently.
+        
+        Each payload goes through `transact` on a worker thread, so the network
+        round-trips overlap on the shared session's connection pool (at most
+        POOL_MAXSIZE in flight) instead of running one after another.
+        
+        A failed call does not stop or hide the others: every payload is sent,
+        and its outcome is reported, so callers can reconcile each request_ref
+        (PayWithAccountError carries the ref of the call that failed).
+        
+        Args:
+            payloads: Transaction payloads, as accepted by `transact`
+            
+        Returns:
+            One outcome per payload, in the same order as `payloads`: the
+            TransactionResult, or the PayWithAccountError the call raised
+        """
+        if not payloads:
+            return []
+        workers = min(len(payloads), self.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._transact_outcome, payloads))
+    
+    def _transact_outcome(
+        self,
+        payload: Dict[str, Any]
+    ) -> Union[TransactionResult, PayWithAccountError]:
+        """Run `transact`, returning its PayWithAccountError instead of raising it."""
+        try:
+            return self.transact(payload)
+        except PayWithAccountError as e:
+            return e
+
     def _extract_request_ref_from_payload(self, payload: Dict[str, Any]) -> str:
         """
         Helper to find an existing request_ref in the payload without modifying it.
@@ -278,33 +492,34 @@ class PayWithAccountClient:
         Post JSON payload to url and handle response / errors consistently.
         Returns TransactionResult or raises PayWithAccountError on non-2xx or network errors.
         """
-        logger.debug(f"PayWithAccount POST {url} request_ref={request_ref_for_error}")
+        logger.debug("PayWithAccount POST %s request_ref=%s", url, request_ref_for_error)
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
+                data=_dumps_payload(payload),
                 headers=headers,
                 timeout=self.timeout
             )
             if response.status_code < 200 or response.status_code >= 300:
                 error_text = response.text
-                logger.error(
-                    f"PayWithAccount API error: status={response.status_code} "
-                    f"request_ref={request_ref_for_error} "
-                    f"response={self._redact_sensitive(error_text)}"
-                )
+                # Redaction scans the whole body, so skip it when ERROR is filtered out
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "PayWithAccount API error: status=%s request_ref=%s response=%s",
+                        response.status_code, request_ref_for_error, self._redact_sensitive(error_text)
+                    )
                 raise PayWithAccountError(
                     status_code=response.status_code,
                     response_text=error_text,
                     request_ref=request_ref_for_error
                 )
-            response_json = response.json()
-            logger.debug(f"PayWithAccount POST success: request_ref={request_ref_for_error}")
+            response_json = _loads_response(response.content)
+            logger.debug("PayWithAccount POST success: request_ref=%s", request_ref_for_error)
             return TransactionResult(request_ref=request_ref_for_error, data=response_json)
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(
-                f"PayWithAccount network error: request_ref={request_ref_for_error} "
-                f"error={type(e).__name__}: {str(e)}"
+                "PayWithAccount network error: request_ref=%s error=%s: %s",
+                request_ref_for_error, type(e).__name__, e
             )
             raise PayWithAccountError(exception=e, request_ref=request_ref_for_error)
 
@@ -325,7 +540,7 @@ class PayWithAccountClient:
             payload.setdefault("request_ref", request_ref)
             body_ref = request_ref
         # Determine header request_ref to compute signature
-        header_ref = header_request_ref or uuid.uuid4().hex
+        header_ref = header_request_ref or _next_ref()
         headers = self.build_headers(header_ref)
         url = f"{self.base_url}{self.query_path}"
         return self._post_and_handle(url, headers, payload, header_ref)
@@ -341,7 +556,7 @@ class PayWithAccountClient:
         if not body_ref and request_ref:
             payload.setdefault("request_ref", request_ref)
             body_ref = request_ref
-        header_ref = header_request_ref or uuid.uuid4().hex
+        header_ref = header_request_ref or _next_ref()
         headers = self.build_headers(header_ref)
         url = f"{self.base_url}{self.validate_path}"
         return self._post_and_handle(url, headers, payload, header_ref)
@@ -24,72 +24,101 @@ Example:
     # needs_validation == False
 """
 
-from typing import Tuple, Optional
+from types import MappingProxyType
+from typing import Mapping, Tuple, Optional
 from django.conf import settings
+from django.core.signals import setting_changed
 
 # Internal enum values
 STATUS_SUCCESS = "SUCCESS"
 STATUS_FAILED = "FAILED"
 STATUS_PENDING = "PENDING"
 
+# Shared result tuples; every map entry with the same outcome is the same object
+_SUCCESS = (STATUS_SUCCESS, False)
+_FAILED = (STATUS_FAILED, False)
+_PENDING = (STATUS_PENDING, False)
+_NEEDS_VALIDATION = (STATUS_PENDING, True)
+
 # Default mapping table: provider status strings -> (internal_status, needs_validation)
-# Keys are normalized to uppercase for case-insensitive matching
-DEFAULT_STATUS_MAP = {
+# Keys are normalized to uppercase for case-insensitive matching. Read-only, since
+# normalize_provider_status hands its values straight back to callers.
+DEFAULT_STATUS_MAP = MappingProxyType({
     # Success indicators
-    "SUCCESS": (STATUS_SUCCESS, False),
-    "SUCCESSFUL": (STATUS_SUCCESS, False),
-    "COMPLETED": (STATUS_SUCCESS, False),
-    "APPROVED": (STATUS_SUCCESS, False),
-    "CONFIRMED": (STATUS_SUCCESS, False),
-    "SETTLED": (STATUS_SUCCESS, False),
-    "PAID": (STATUS_SUCCESS, False),
-    "PROCESSED": (STATUS_SUCCESS, False),
+    "SUCCESS": _SUCCESS,
+    "SUCCESSFUL": _SUCCESS,
+    "COMPLETED": _SUCCESS,
+    "APPROVED": _SUCCESS,
+    "CONFIRMED": _SUCCESS,
+    "SETTLED": _SUCCESS,
+    "PAID": _SUCCESS,
+    "PROCESSED": _SUCCESS,
     
     # Failed indicators
-    "FAILED": (STATUS_FAILED, False),
-    "ERROR": (STATUS_FAILED, False),
-    "DECLINED": (STATUS_FAILED, False),
-    "REJECTED": (STATUS_FAILED, False),
-    "CANCELLED": (STATUS_FAILED, False),
-    "TIMEOUT": (STATUS_FAILED, False),
-    "EXPIRED": (STATUS_FAILED, False),
-    "ABORTED": (STATUS_FAILED, False),
-    "INVALID": (STATUS_FAILED, False),
+    "FAILED": _FAILED,
+    "ERROR": _FAILED,
+    "DECLINED": _FAILED,
+    "REJECTED": _FAILED,
+    "CANCELLED": _FAILED,
+    "TIMEOUT": _FAILED,
+    "EXPIRED": _FAILED,
+    "ABORTED": _FAILED,
+    "INVALID": _FAILED,
     
     # Pending indicators
-    "PENDING": (STATUS_PENDING, False),
-    "PROCESSING": (STATUS_PENDING, False),
-    "INITIATED": (STATUS_PENDING, False),
-    "IN_PROGRESS": (STATUS_PENDING, False),
-    "AWAITING": (STATUS_PENDING, False),
-    "QUEUED": (STATUS_PENDING, False),
+    "PENDING": _PENDING,
+    "PROCESSING": _PENDING,
+    "INITIATED": _PENDING,
+    "IN_PROGRESS": _PENDING,
+    "AWAITING": _PENDING,
+    "QUEUED": _PENDING,
     
     # OTP / Validation required
-    "WAITINGFOROTP": (STATUS_PENDING, True),
-    "WAITING_FOR_OTP": (STATUS_PENDING, True),
-    "OTP_PENDING": (STATUS_PENDING, True),
-    "PENDINGVALIDATION": (STATUS_PENDING, True),
-    "PENDING_VALIDATION": (STATUS_PENDING, True),
-    "VALIDATION_REQUIRED": (STATUS_PENDING, True),
-    "AWAITING_VALIDATION": (STATUS_PENDING, True),
-    "REQUIRES_OTP": (STATUS_PENDING, True),
-    "OTP_REQUIRED": (STATUS_PENDING, True),
-}
-
-
-def _get_status_map() -> dict:
+    "WAITINGFOROTP": _NEEDS_VALIDATION,
+    "WAITING_FOR_OTP": _NEEDS_VALIDATION,
+    "OTP_PENDING": _NEEDS_VALIDATION,
+    "PENDINGVALIDATION": _NEEDS_VALIDATION,
+    "PENDING_VALIDATION": _NEEDS_VALIDATION,
+    "VALIDATION_REQUIRED": _NEEDS_VALIDATION,
+    "AWAITING_VALIDATION": _NEEDS_VALIDATION,
+    "REQUIRES_OTP": _NEEDS_VALIDATION,
+    "OTP_REQUIRED": _NEEDS_VALIDATION,
+})
+
+
+# Result for None, non-string and unmapped statuses
+_DEFAULT_RESULT = _PENDING
+
+# Active mapping, resolved from settings on first use
+_status_map = None
+
+
+def _get_status_map() -> Mapping[str, Tuple[str, bool]]:
     """
     Retrieve status mapping from settings, with fallback to defaults.
     
     Looks for settings.PAYWITHACCOUNT_STATUS_MAP. If not defined,
-    uses DEFAULT_STATUS_MAP.
+    uses DEFAULT_STATUS_MAP. The result is cached at module level so
+    lookups skip the settings access; `setting_changed` (sent by
+    override_settings) clears it.
     
     Returns:
-        Dict mapping uppercase status strings to (internal_status, needs_validation) tuples
+        Mapping of uppercase status strings to (internal_status, needs_validation) tuples
     """
-    if hasattr(settings, 'PAYWITHACCOUNT_STATUS_MAP'):
-        return settings.PAYWITHACCOUNT_STATUS_MAP
-    return DEFAULT_STATUS_MAP
+    global _status_map
+    if _status_map is None:
+        _status_map = getattr(settings, 'PAYWITHACCOUNT_STATUS_MAP', DEFAULT_STATUS_MAP)
+    return _status_map
+
+
+def _reset_status_map(*, setting, **kwargs):
+    """Drop the cached mapping when PAYWITHACCOUNT_STATUS_MAP changes."""
+    global _status_map
+    if setting == 'PAYWITHACCOUNT_STATUS_MAP':
+        _status_map = None
+
+
+setting_changed.connect(_reset_status_map)
 
 
 def normalize_provider_status(raw_status: Optional[str]) -> Tuple[str, bool]:
@@ -127,29 +156,27 @@ def normalize_provider_status(raw_status: Optional[str]) -> Tuple[str, bool]:
     """
     # Handle None or empty status
     if not raw_status or not isinstance(raw_status, str):
-        return STATUS_PENDING, False
-    
-    # Normalize to uppercase for lookup
-    normalized_key = raw_status.upper().strip()
+        return _DEFAULT_RESULT
     
-    # Get configured mapping
-    status_map = _get_status_map()
+    # Cached mapping; only the first call (or one after a settings change) resolves it
+    status_map = _status_map if _status_map is not None else _get_status_map()
     
-    # Look up in map; default to PENDING if not found
-    if normalized_key in status_map:
-        return status_map[normalized_key]
+    # Fast path: providers mostly send the canonical uppercase key already
+    result = status_map.get(raw_status)
+    if result is not None:
+        return result
     
-    # Unknown status defaults to PENDING with no validation requirement
-    return STATUS_PENDING, False
+    # Case-insensitive lookup; unknown statuses are PENDING with no validation requirement
+    return status_map.get(raw_status.upper().strip(), _DEFAULT_RESULT)
 
 
-def get_available_status_map() -> dict:
+def get_available_status_map() -> Mapping[str, Tuple[str, bool]]:
     """
     Retrieve the currently active status mapping.
     
     Useful for debugging, logging, or dynamically checking what statuses are mapped.
     
     Returns:
-        Dict of provider status -> (internal_status, needs_validation)
+        Mapping of provider status -> (internal_status, needs_validation)
     """
     return _get_status_map()
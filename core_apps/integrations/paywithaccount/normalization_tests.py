@@ -9,7 +9,7 @@ Tests verify:
 - Configurable status mapping via settings override
 """
 
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, override_settings
 from core_apps.integrations.paywithaccount.normalization import (
     normalize_provider_status,
     get_available_status_map,
@@ -18,244 +18,72 @@ from core_apps.integrations.paywithaccount.normalization import (
     STATUS_PENDING,
 )
 
+# Provider statuses covered by the default map, by expected outcome
+SUCCESS_STATUSES = (
+    "SUCCESS", "SUCCESSFUL", "COMPLETED", "APPROVED",
+    "CONFIRMED", "SETTLED", "PAID", "PROCESSED",
+)
+FAILED_STATUSES = (
+    "FAILED", "ERROR", "DECLINED", "REJECTED", "CANCELLED",
+    "TIMEOUT", "EXPIRED", "ABORTED", "INVALID",
+)
+PENDING_STATUSES = (
+    "PENDING", "PROCESSING", "INITIATED", "IN_PROGRESS", "AWAITING", "QUEUED",
+)
+VALIDATION_STATUSES = (
+    "WaitingForOTP", "WAITING_FOR_OTP", "OTP_PENDING", "PendingValidation",
+    "PENDING_VALIDATION", "VALIDATION_REQUIRED", "AWAITING_VALIDATION",
+    "REQUIRES_OTP", "OTP_REQUIRED",
+)
 
-class NormalizeProviderStatusSuccessTest(TestCase):
-    """Tests for success status normalization"""
-    
-    def test_success_status(self):
-        """Test 'SUCCESS' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("SUCCESS")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_successful_status(self):
-        """Test 'SUCCESSFUL' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("SUCCESSFUL")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_completed_status(self):
-        """Test 'COMPLETED' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("COMPLETED")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_approved_status(self):
-        """Test 'APPROVED' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("APPROVED")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_confirmed_status(self):
-        """Test 'CONFIRMED' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("CONFIRMED")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_settled_status(self):
-        """Test 'SETTLED' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("SETTLED")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_paid_status(self):
-        """Test 'PAID' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("PAID")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_processed_status(self):
-        """Test 'PROCESSED' maps to SUCCESS"""
-        status, needs_validation = normalize_provider_status("PROCESSED")
-        assert status == STATUS_SUCCESS
-        assert needs_validation is False
-    
-    def test_success_case_insensitive(self):
-        """Test case-insensitive matching for success"""
-        for variant in ["success", "SUCCESS", "Success", "sUcCeSs"]:
-            status, needs_validation = normalize_provider_status(variant)
-            assert status == STATUS_SUCCESS
-            assert needs_validation is False
-
-
-class NormalizeProviderStatusFailedTest(TestCase):
-    """Tests for failed status normalization"""
-    
-    def test_failed_status(self):
-        """Test 'FAILED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("FAILED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_error_status(self):
-        """Test 'ERROR' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("ERROR")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_declined_status(self):
-        """Test 'DECLINED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("DECLINED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_rejected_status(self):
-        """Test 'REJECTED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("REJECTED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_cancelled_status(self):
-        """Test 'CANCELLED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("CANCELLED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_timeout_status(self):
-        """Test 'TIMEOUT' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("TIMEOUT")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_expired_status(self):
-        """Test 'EXPIRED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("EXPIRED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_aborted_status(self):
-        """Test 'ABORTED' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("ABORTED")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_invalid_status(self):
-        """Test 'INVALID' maps to FAILED"""
-        status, needs_validation = normalize_provider_status("INVALID")
-        assert status == STATUS_FAILED
-        assert needs_validation is False
-    
-    def test_failed_case_insensitive(self):
-        """Test case-insensitive matching for failed"""
-        for variant in ["failed", "FAILED", "Failed", "fAiLeD"]:
-            status, needs_validation = normalize_provider_status(variant)
-            assert status == STATUS_FAILED
-            assert needs_validation is False
-
-
-class NormalizeProviderStatusPendingTest(TestCase):
-    """Tests for pending status normalization"""
-    
-    def test_pending_status(self):
-        """Test 'PENDING' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("PENDING")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_processing_status(self):
-        """Test 'PROCESSING' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("PROCESSING")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_initiated_status(self):
-        """Test 'INITIATED' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("INITIATED")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_in_progress_status(self):
-        """Test 'IN_PROGRESS' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("IN_PROGRESS")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_awaiting_status(self):
-        """Test 'AWAITING' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("AWAITING")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_queued_status(self):
-        """Test 'QUEUED' maps to PENDING"""
-        status, needs_validation = normalize_provider_status("QUEUED")
-        assert status == STATUS_PENDING
-        assert needs_validation is False
-    
-    def test_pending_case_insensitive(self):
-        """Test case-insensitive matching for pending"""
-        for variant in ["pending", "PENDING", "Pending", "pEnDiNg"]:
-            status, needs_validation = normalize_provider_status(variant)
-            assert status == STATUS_PENDING
-            assert needs_validation is False
-
-
-class NormalizeProviderStatusValidationTest(TestCase):
-    """Tests for OTP/validation status normalization"""
-    
-    def test_waiting_for_otp_no_underscore(self):
-        """Test 'WaitingForOTP' flags validation required"""
-        status, needs_validation = normalize_provider_status("WaitingForOTP")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_waiting_for_otp_with_underscore(self):
-        """Test 'WAITING_FOR_OTP' flags validation required"""
-        status, needs_validation = normalize_provider_status("WAITING_FOR_OTP")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_otp_pending(self):
-        """Test 'OTP_PENDING' flags validation required"""
-        status, needs_validation = normalize_provider_status("OTP_PENDING")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_pending_validation_no_underscore(self):
-        """Test 'PendingValidation' flags validation required"""
-        status, needs_validation = normalize_provider_status("PendingValidation")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_pending_validation_with_underscore(self):
-        """Test 'PENDING_VALIDATION' flags validation required"""
-        status, needs_validation = normalize_provider_status("PENDING_VALIDATION")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_validation_required(self):
-        """Test 'VALIDATION_REQUIRED' flags validation required"""
-        status, needs_validation = normalize_provider_status("VALIDATION_REQUIRED")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_awaiting_validation(self):
-        """Test 'AWAITING_VALIDATION' flags validation required"""
-        status, needs_validation = normalize_provider_status("AWAITING_VALIDATION")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_requires_otp(self):
-        """Test 'REQUIRES_OTP' flags validation required"""
-        status, needs_validation = normalize_provider_status("REQUIRES_OTP")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_otp_required(self):
-        """Test 'OTP_REQUIRED' flags validation required"""
-        status, needs_validation = normalize_provider_status("OTP_REQUIRED")
-        assert status == STATUS_PENDING
-        assert needs_validation is True
-    
-    def test_validation_case_insensitive(self):
-        """Test case-insensitive matching for validation statuses"""
-        for variant in ["waitingforotp", "WAITINGFOROTP", "WaitingForOtp"]:
-            status, needs_validation = normalize_provider_status(variant)
-            assert status == STATUS_PENDING
-            assert needs_validation is True
-
-
-class NormalizeProviderStatusEdgeCasesTest(TestCase):
+# Provider-specific map used by the configurable-mapping tests
+CUSTOM_STATUS_MAP = {
+    "CUSTOM_SUCCESS": ("SUCCESS", False),
+    "CUSTOM_FAILED": ("FAILED", False),
+    "CUSTOM_PENDING": ("PENDING", False),
+    "CUSTOM_VALIDATION": ("PENDING", True),
+}
+
+
+class NormalizeProviderStatusMappingTest(SimpleTestCase):
+    """Tests for the default mapping, one subTest per provider status"""
+    
+    def assert_statuses(self, raw_statuses, expected):
+        """Assert every raw status normalizes to the `expected` (status, needs_validation)"""
+        for raw_status in raw_statuses:
+            with self.subTest(raw_status=raw_status):
+                self.assertEqual(normalize_provider_status(raw_status), expected)
+    
+    def test_success_statuses(self):
+        """Test success indicators (any case) map to SUCCESS, no validation"""
+        self.assert_statuses(
+            SUCCESS_STATUSES + ("success", "Success", "sUcCeSs"),
+            (STATUS_SUCCESS, False)
+        )
+    
+    def test_failed_statuses(self):
+        """Test failure indicators (any case) map to FAILED, no validation"""
+        self.assert_statuses(
+            FAILED_STATUSES + ("failed", "Failed", "fAiLeD"),
+            (STATUS_FAILED, False)
+        )
+    
+    def test_pending_statuses(self):
+        """Test in-progress indicators (any case) map to PENDING, no validation"""
+        self.assert_statuses(
+            PENDING_STATUSES + ("pending", "Pending", "pEnDiNg"),
+            (STATUS_PENDING, False)
+        )
+    
+    def test_validation_statuses(self):
+        """Test OTP/validation indicators (any case) map to PENDING with validation"""
+        self.assert_statuses(
+            VALIDATION_STATUSES + ("waitingforotp", "WAITINGFOROTP", "WaitingForOtp"),
+            (STATUS_PENDING, True)
+        )
+
+
+class NormalizeProviderStatusEdgeCasesTest(SimpleTestCase):
     """Tests for edge cases and null handling"""
     
     def test_none_status(self):
@@ -295,17 +123,11 @@ class NormalizeProviderStatusEdgeCasesTest(TestCase):
         assert needs_validation is False
 
 
-class NormalizeProviderStatusConfigurableTest(TestCase):
+# Applied once for the class rather than re-patched around each method
+@override_settings(PAYWITHACCOUNT_STATUS_MAP=CUSTOM_STATUS_MAP)
+class NormalizeProviderStatusConfigurableTest(SimpleTestCase):
     """Tests for settings-based status mapping override"""
     
-    @override_settings(
-        PAYWITHACCOUNT_STATUS_MAP={
-            "CUSTOM_SUCCESS": ("SUCCESS", False),
-            "CUSTOM_FAILED": ("FAILED", False),
-            "CUSTOM_PENDING": ("PENDING", False),
-            "CUSTOM_VALIDATION": ("PENDING", True),
-        }
-    )
     def test_custom_status_mapping(self):
         """Test custom status mapping from settings"""
         # Custom success
@@ -328,22 +150,23 @@ class NormalizeProviderStatusConfigurableTest(TestCase):
         assert status == STATUS_PENDING
         assert needs_validation is True
     
-    @override_settings(
-        PAYWITHACCOUNT_STATUS_MAP={
-            "CUSTOM_SUCCESS": ("SUCCESS", False),
-            "CUSTOM_FAILED": ("FAILED", False),
-            "CUSTOM_PENDING": ("PENDING", False),
-            "CUSTOM_VALIDATION": ("PENDING", True),
-        }
-    )
     def test_unknown_status_with_custom_map(self):
         """Test unknown status still defaults to PENDING with custom map"""
         status, needs_validation = normalize_provider_status("NOT_IN_CUSTOM_MAP")
         assert status == STATUS_PENDING
         assert needs_validation is False
+    
+    def test_cached_map_follows_settings_override(self):
+        """Test that the cached status map is refreshed when the setting changes"""
+        assert normalize_provider_status("CUSTOM_SUCCESS") == (STATUS_SUCCESS, False)
+        
+        with override_settings(PAYWITHACCOUNT_STATUS_MAP={"CUSTOM_SUCCESS": ("FAILED", False)}):
+            assert normalize_provider_status("CUSTOM_SUCCESS") == (STATUS_FAILED, False)
+        
+        assert normalize_provider_status("CUSTOM_SUCCESS") == (STATUS_SUCCESS, False)
 
 
-class GetAvailableStatusMapTest(TestCase):
+class GetAvailableStatusMapTest(SimpleTestCase):
     """Tests for get_available_status_map() function"""
     
     def test_get_default_status_map(self):
@@ -360,6 +183,14 @@ class GetAvailableStatusMapTest(TestCase):
         assert status_map["SUCCESS"] == (STATUS_SUCCESS, False)
         assert status_map["WAITINGFOROTP"] == (STATUS_PENDING, True)
     
+    def test_default_status_map_is_read_only(self):
+        """Test that the default map cannot be mutated through the accessor"""
+        status_map = get_available_status_map()
+        
+        with self.assertRaises(TypeError):
+            status_map["SUCCESS"] = (STATUS_FAILED, False)
+        assert normalize_provider_status("SUCCESS") == (STATUS_SUCCESS, False)
+    
     @override_settings(
         PAYWITHACCOUNT_STATUS_MAP={
             "CUSTOM_ONLY": ("PENDING", False),
@@ -4,7 +4,7 @@ Tests for PayWithAccountService.
 
 import unittest
 from unittest.mock import patch, MagicMock
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from .service import PayWithAccountService
 from .client import TransactionResult, PayWithAccountError
@@ -15,9 +15,8 @@ class TestPayWithAccountService(TestCase):
     
     def setUp(self):
         """Set up test service."""
-        self.settings_patcher = patch.dict(
-            'django.conf.settings.PAYWITHACCOUNT',
-            {
+        self.settings_override = override_settings(
+            PAYWITHACCOUNT={
                 'base_url': 'https://test-api.example.com',
                 'transact_path': '/v2/transact',
                 'api_key': 'test-key-123',
@@ -28,11 +27,11 @@ class TestPayWithAccountService(TestCase):
                 'webhook_secret': 'webhook-secret-789'
             }
         )
-        self.settings_patcher.start()
+        self.settings_override.enable()
         self.service = PayWithAccountService()
     
     def tearDown(self):
-        self.settings_patcher.stop()
+        self.settings_override.disable()
     
     @patch('core_apps.integrations.paywithaccount.service.PayWithAccountClient.transact')
     def test_transact_wraps_client_result(self, mock_transact):
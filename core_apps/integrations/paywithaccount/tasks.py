@@ -0,0 +1,56 @@
+"""
+Optional Celery tasks for running PayWithAccount calls off the request thread.
+
+Only usable when Celery is installed; without it the module defines no tasks
+and callers keep calling PayWithAccountClient directly.
+
+Example:
+    from core_apps.integrations.paywithaccount.tasks import transact_task
+
+    transact_task.delay(payload, request_ref)
+"""
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+try:
+    from celery import shared_task
+
+    @shared_task(bind=True, max_retries=5)
+    def transact_task(self, payload: Dict[str, Any], request_ref: str) -> Dict[str, Any]:
+        """
+        Run PayWithAccountClient.transact in a worker.
+
+        request_ref is required and reused on every retry, so the provider
+        sees one idempotent request rather than a new one per attempt.
+        Network errors and 5xx responses are retried with exponential
+        backoff; other API errors (4xx) fail the task immediately.
+
+        Args:
+            payload: Transaction payload, as accepted by `transact`
+            request_ref: Request reference (idempotency key) for the call
+
+        Returns:
+            Provider response JSON
+        """
+        from core_apps.integrations.paywithaccount.client import (
+            PayWithAccountClient,
+            PayWithAccountError
+        )
+
+        try:
+            return PayWithAccountClient().transact(payload, request_ref=request_ref).data
+        except PayWithAccountError as e:
+            if e.exception is None and e.status_code < 500:
+                raise
+            logger.warning(
+                "PayWithAccount transact failed, retrying: request_ref=%s attempt=%d",
+                request_ref,
+                self.request.retries + 1
+            )
+            raise self.retry(exc=e, countdown=2 ** self.request.retries)
+
+except ImportError:
+    # Celery not installed; tasks will not be available
+    pass
@@ -2,17 +2,38 @@ import unittest
 from unittest.mock import patch, MagicMock
 import json
 import uuid
-from hashlib import md5
-from django.test import TestCase
+from hashlib import md5, blake2b
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
 from django.conf import settings
 
 from .client import (
     PayWithAccountClient,
     PayWithAccountError,
     compute_signature,
-    TransactionResult
+    TransactionResult,
+    _next_ref,
+    _REF_BATCH
 )
 
+try:
+    from celery.exceptions import Retry
+    from .tasks import transact_task
+    HAS_CELERY = True
+except ImportError:
+    HAS_CELERY = False
+
+TEST_PAYWITHACCOUNT = {
+    'base_url': 'https://test-api.example.com',
+    'transact_path': '/v2/transact',
+    'api_key': 'test-key-123',
+    'client_secret': 'test-secret-456',
+    'mock_mode': 'false',
+    'request_type': 'invoice',
+    'timeout_seconds': 30,
+    'webhook_secret': 'webhook-secret-789'
+}
+
 
 class TestComputeSignature(unittest.TestCase):
     """Tests for compute_signature helper function."""
@@ -45,6 +66,31 @@ class TestComputeSignature(unittest.TestCase):
         sig2 = compute_signature("ref2", secret)
         
         self.assertNotEqual(sig1, sig2)
+    
+    def test_signature_alternative_algorithm(self):
+        """Test that a non-default digest hashes the same request_ref;secret input."""
+        expected = blake2b(b"ref1;secret", digest_size=16).hexdigest()
+        
+        result = compute_signature("ref1", "secret", "blake2b128")
+        
+        self.assertEqual(result, expected)
+
+
+class TestNextRef(unittest.TestCase):
+    """Tests for the pooled request_ref generator."""
+    
+    def test_ref_is_32_char_hex(self):
+        """Test that refs keep the uuid4().hex shape."""
+        ref = _next_ref()
+        
+        self.assertEqual(len(ref), 32)
+        self.assertTrue(all(c in "0123456789abcdef" for c in ref))
+    
+    def test_refs_unique_across_batch_refills(self):
+        """Test that refs stay unique when the pool is refilled."""
+        refs = [_next_ref() for _ in range(_REF_BATCH * 3)]
+        
+        self.assertEqual(len(set(refs)), len(refs))
 
 
 class TestPayWithAccountError(unittest.TestCase):
@@ -88,24 +134,12 @@ class TestPayWithAccountClient(TestCase):
     
     def setUp(self):
         """Set up test client with mocked settings."""
-        self.settings_patcher = patch.dict(
-            'django.conf.settings.PAYWITHACCOUNT',
-            {
-                'base_url': 'https://test-api.example.com',
-                'transact_path': '/v2/transact',
-                'api_key': 'test-key-123',
-                'client_secret': 'test-secret-456',
-                'mock_mode': 'false',
-                'request_type': 'invoice',
-                'timeout_seconds': 30,
-                'webhook_secret': 'webhook-secret-789'
-            }
-        )
-        self.settings_patcher.start()
+        self.settings_override = override_settings(PAYWITHACCOUNT=TEST_PAYWITHACCOUNT)
+        self.settings_override.enable()
         self.client = PayWithAccountClient()
     
     def tearDown(self):
-        self.settings_patcher.stop()
+        self.settings_override.disable()
     
     def test_client_initialization(self):
         """Test client initializes with settings."""
@@ -147,7 +181,53 @@ class TestPayWithAccountClient(TestCase):
         self.assertNotIn("test-key-123", redacted)
         self.assertNotIn("test-secret-456", redacted)
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    def test_redact_sensitive_overlapping_credentials(self):
+        """Test that a secret containing the api key is redacted whole."""
+        config = dict(settings.PAYWITHACCOUNT, client_secret='test-key-123-secret')
+        with override_settings(PAYWITHACCOUNT=config):
+            client = PayWithAccountClient()
+        
+        redacted = client._redact_sensitive("key=test-key-123 secret=test-key-123-secret")
+        
+        self.assertEqual(redacted, "key=***REDACTED_API_KEY*** secret=***REDACTED_SECRET***")
+
+    def test_build_headers_uses_configured_signature_algorithm(self):
+        """Test that PAYWITHACCOUNT['signature_algorithm'] selects the header digest."""
+        config = dict(settings.PAYWITHACCOUNT, signature_algorithm='sha256')
+        with override_settings(PAYWITHACCOUNT=config):
+            headers = PayWithAccountClient().build_headers("test-ref-001")
+        
+        self.assertEqual(
+            headers["Signature"],
+            compute_signature("test-ref-001", 'test-secret-456', 'sha256')
+        )
+    
+    def test_unknown_signature_algorithm_rejected(self):
+        """Test that an unsupported signature_algorithm fails at client construction."""
+        config = dict(settings.PAYWITHACCOUNT, signature_algorithm='crc32')
+        with override_settings(PAYWITHACCOUNT=config):
+            with self.assertRaises(ImproperlyConfigured):
+                PayWithAccountClient()
+    
+    def test_config_follows_settings_override(self):
+        """Test that the cached client config is re-read when PAYWITHACCOUNT changes."""
+        other = dict(settings.PAYWITHACCOUNT, base_url='https://other-api.example.com')
+        with override_settings(PAYWITHACCOUNT=other):
+            self.assertEqual(PayWithAccountClient().base_url, 'https://other-api.example.com')
+        
+        self.assertEqual(PayWithAccountClient().base_url, 'https://test-api.example.com')
+
+    def test_client_uses_pooled_session(self):
+        """Test that the client mounts a pooled adapter on its session."""
+        adapter = self.client.session.get_adapter('https://test-api.example.com')
+
+        self.assertEqual(adapter._pool_maxsize, PayWithAccountClient.POOL_MAXSIZE)
+    
+    def test_clients_share_one_session(self):
+        """Test that separately built clients reuse the same pooled session."""
+        self.assertIs(PayWithAccountClient().session, self.client.session)
+
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_success(self, mock_post):
         """Test successful transaction request."""
         request_ref = uuid.uuid4().hex
@@ -155,7 +235,7 @@ class TestPayWithAccountClient(TestCase):
         
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_post.return_value = mock_response
         
         payload = {
@@ -179,14 +259,14 @@ class TestPayWithAccountClient(TestCase):
             call_args[0][0]
         )
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_generates_request_ref(self, mock_post):
         """Test that request_ref is generated if not provided."""
         response_data = {"status": "success"}
         
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_post.return_value = mock_response
         
         payload = {"transaction": {"amount": 50.00}}
@@ -198,14 +278,14 @@ class TestPayWithAccountClient(TestCase):
         self.assertEqual(len(result.request_ref), 32)  # UUID hex is 32 chars
         self.assertTrue(all(c in '0123456789abcdef' for c in result.request_ref))
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_injects_mock_mode(self, mock_post):
         """Test that mock_mode is injected into payload if not present."""
         response_data = {"status": "success"}
         
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_post.return_value = mock_response
         
         payload = {"transaction": {"amount": 100.00}}
@@ -214,18 +294,18 @@ class TestPayWithAccountClient(TestCase):
         
         # Verify mock_mode was injected
         call_args = mock_post.call_args
-        sent_payload = call_args.kwargs['json']
+        sent_payload = json.loads(call_args.kwargs['data'])
         self.assertIn('mock_mode', sent_payload['transaction'])
         self.assertEqual(sent_payload['transaction']['mock_mode'], 'false')
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_preserves_existing_mock_mode(self, mock_post):
         """Test that existing mock_mode in payload is not overwritten."""
         response_data = {"status": "success"}
         
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_post.return_value = mock_response
         
         payload = {"transaction": {"amount": 100.00, "mock_mode": "test"}}
@@ -234,10 +314,51 @@ class TestPayWithAccountClient(TestCase):
         
         # Verify mock_mode was not overwritten
         call_args = mock_post.call_args
-        sent_payload = call_args.kwargs['json']
+        sent_payload = json.loads(call_args.kwargs['data'])
         self.assertEqual(sent_payload['transaction']['mock_mode'], "test")
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_transact_many_returns_results_in_order(self, mock_post):
+        """Test that concurrent transacts return one result per payload, in order."""
+        def echo_amount(url, data, headers, timeout):
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({"amount": json.loads(data)["transaction"]["amount"]}).encode()
+            return response
+        
+        mock_post.side_effect = echo_amount
+        payloads = [{"transaction": {"amount": amount}} for amount in (100.00, 200.00, 300.00)]
+        
+        results = self.client.transact_many(payloads)
+        
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual([result.data["amount"] for result in results], [100.00, 200.00, 300.00])
+        self.assertEqual(len({result.request_ref for result in results}), 3)
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_transact_many_reports_each_outcome(self, mock_post):
+        """Test that one failing payload does not hide the results of the others."""
+        def fail_second(url, data, headers, timeout):
+            amount = json.loads(data)["transaction"]["amount"]
+            response = MagicMock()
+            response.status_code = 502 if amount == 200.00 else 200
+            response.text = '{"error": "Bad gateway"}'
+            response.content = json.dumps({"amount": amount}).encode()
+            return response
+        
+        mock_post.side_effect = fail_second
+        payloads = [{"transaction": {"amount": amount}} for amount in (100.00, 200.00, 300.00)]
+        
+        first, second, third = self.client.transact_many(payloads)
+        
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(first.data["amount"], 100.00)
+        self.assertIsInstance(second, PayWithAccountError)
+        self.assertEqual(second.status_code, 502)
+        self.assertEqual(third.data["amount"], 300.00)
+        self.assertEqual(len({first.request_ref, second.request_ref, third.request_ref}), 3)
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_error_non_2xx(self, mock_post):
         """Test that non-2xx status raises PayWithAccountError."""
         request_ref = uuid.uuid4().hex
@@ -255,7 +376,7 @@ class TestPayWithAccountClient(TestCase):
         self.assertEqual(ctx.exception.status_code, 400)
         self.assertEqual(ctx.exception.request_ref, request_ref)
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_error_500(self, mock_post):
         """Test handling of 500 server error."""
         mock_response = MagicMock()
@@ -271,7 +392,7 @@ class TestPayWithAccountClient(TestCase):
         self.assertEqual(ctx.exception.status_code, 500)
         self.assertIn('Internal Server Error', ctx.exception.response_text)
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_network_error(self, mock_post):
         """Test handling of network errors."""
         import requests
@@ -287,14 +408,14 @@ class TestPayWithAccountClient(TestCase):
         self.assertIsNotNone(ctx.exception.exception)
         self.assertIn('Connection refused', str(ctx.exception.exception))
     
-    @patch('core_apps.integrations.paywithaccount.client.requests.post')
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
     def test_transact_headers_contain_signature(self, mock_post):
         """Test that request includes correct authorization and signature headers."""
         request_ref = "test-ref-abc123"
         
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = b'{"status": "success"}'
         mock_post.return_value = mock_response
         
         payload = {"transaction": {"amount": 100.00}}
@@ -311,5 +432,78 @@ class TestPayWithAccountClient(TestCase):
         self.assertEqual(headers['Content-Type'], 'application/json')
 
 
+
+@unittest.skipUnless(HAS_CELERY, "Celery is not installed")
+@override_settings(PAYWITHACCOUNT=TEST_PAYWITHACCOUNT)
+class TestTransactTask(TestCase):
+    """Tests for transact_task, run eagerly with apply()."""
+    
+    @staticmethod
+    def _response(status_code, body=b'{"status": "success"}'):
+        response = MagicMock()
+        response.status_code = status_code
+        response.content = body
+        response.text = body.decode()
+        return response
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_client_error_fails_without_retry(self, mock_post):
+        """Test that a 4xx response fails the task immediately."""
+        mock_post.return_value = self._response(400, b'{"error": "Invalid request"}')
+        
+        with patch.object(transact_task, 'retry') as mock_retry:
+            result = transact_task.apply(args=({"transaction": {"amount": 100.00}}, "task-ref-400"))
+        
+        self.assertTrue(result.failed())
+        self.assertIsInstance(result.result, PayWithAccountError)
+        self.assertEqual(result.result.status_code, 400)
+        mock_retry.assert_not_called()
+        self.assertEqual(mock_post.call_count, 1)
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_server_error_retries_with_backoff(self, mock_post):
+        """Test that a 5xx response retries after 2 ** retries seconds."""
+        mock_post.return_value = self._response(502, b'{"error": "Bad gateway"}')
+        
+        with patch.object(transact_task, 'retry', side_effect=Retry()) as mock_retry:
+            transact_task.apply(args=({"transaction": {"amount": 100.00}}, "task-ref-502"), retries=2)
+        
+        mock_retry.assert_called_once()
+        self.assertEqual(mock_retry.call_args.kwargs['countdown'], 4)
+        self.assertEqual(mock_retry.call_args.kwargs['exc'].status_code, 502)
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_network_error_retries_with_backoff(self, mock_post):
+        """Test that a network error retries after 2 ** retries seconds."""
+        import requests
+        
+        mock_post.side_effect = requests.ConnectionError("Connection reset")
+        
+        with patch.object(transact_task, 'retry', side_effect=Retry()) as mock_retry:
+            transact_task.apply(args=({"transaction": {"amount": 100.00}}, "task-ref-net"))
+        
+        mock_retry.assert_called_once()
+        self.assertEqual(mock_retry.call_args.kwargs['countdown'], 1)
+        self.assertIsInstance(mock_retry.call_args.kwargs['exc'].exception, requests.ConnectionError)
+    
+    @patch('core_apps.integrations.paywithaccount.client.requests.Session.post')
+    def test_retries_reuse_request_ref(self, mock_post):
+        """Test that every attempt is signed with the same request_ref."""
+        import requests
+        
+        mock_post.side_effect = [
+            self._response(503, b'{"error": "Unavailable"}'),
+            requests.ConnectionError("Connection reset"),
+            self._response(200),
+        ]
+        
+        result = transact_task.apply(args=({"transaction": {"amount": 100.00}}, "task-ref-retry"))
+        
+        self.assertEqual(result.get(), {"status": "success"})
+        self.assertEqual(mock_post.call_count, 3)
+        signatures = {call.kwargs['headers']['Signature'] for call in mock_post.call_args_list}
+        self.assertEqual(signatures, {compute_signature("task-ref-retry", 'test-secret-456')})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-16 16:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("transactions", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("status", "SUCCESS")),
+                fields=["goal", "type"],
+                include=("amount",),
+                name="tx_goal_success_type_idx",
+            ),
+        ),
+    ]
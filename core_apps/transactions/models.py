@@ -63,6 +63,16 @@ class Transaction(models.Model):
         # Append-only table - prevent accidental updates
         get_latest_by = 'created_at'
         ordering = ['-created_at']
+        indexes = [
+            # Goal summaries sum SUCCESS rows per goal, split by type. Partial and
+            # covering amount, so each sum is an index-only scan on Postgres.
+            models.Index(
+                fields=['goal', 'type'],
+                include=['amount'],
+                condition=models.Q(status='SUCCESS'),
+                name='tx_goal_success_type_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.request_ref} - {self.type} - {self.amount} {self.currency}"